@@ -1,8 +1,48 @@
+from datetime import date
+
 from django.contrib import admin
 
 from .models import AvalonDevice, BitAxeDevice, BitAxeHardwareLog, BitAxeMiningStats, BitAxePoolStats, BitAxeSystemInfo, CollectorSettings
 
 
+class RangeBasedDateHierarchyMixin:
+    """Translate date_hierarchy drilldown params into a half-open range filter.
+
+    Django's date_hierarchy emits EXTRACT(year/month/day) predicates that
+    cannot use the btree index on the timestamp column. Rewriting the params
+    to `field__gte`/`field__lt` lets Postgres do a range scan on the
+    -recorded_at index instead of a full-table EXTRACT scan.
+    """
+
+    def changelist_view(self, request, extra_context=None):
+        field = self.date_hierarchy
+        if field:
+            year = request.GET.get(f'{field}__year')
+            month = request.GET.get(f'{field}__month')
+            day = request.GET.get(f'{field}__day')
+            if year and year.isdigit():
+                try:
+                    start = date(int(year), int(month) if month else 1, int(day) if day else 1)
+                except ValueError:
+                    # Malformed or out-of-range month/day params: leave the
+                    # query string untouched and let the stock changelist
+                    # reject them (redirects to ?e=1) instead of crashing.
+                    start = None
+                if start is not None:
+                    if day:
+                        end = date.fromordinal(start.toordinal() + 1)
+                    elif month:
+                        end = date(start.year + 1, 1, 1) if start.month == 12 else date(start.year, start.month + 1, 1)
+                    else:
+                        end = date(start.year + 1, 1, 1)
+                    request.GET = request.GET.copy()
+                    for param in (f'{field}__year', f'{field}__month', f'{field}__day'):
+                        request.GET.pop(param, None)
+                    request.GET[f'{field}__gte'] = start.isoformat()
+                    request.GET[f'{field}__lt'] = end.isoformat()
+        return super().changelist_view(request, extra_context)
+
+
 @admin.register(BitAxeDevice)
 class BitAxeDeviceAdmin(admin.ModelAdmin):
     list_display = ('device_id', 'device_name', 'ip_address', 'is_active', 'created_at')
@@ -12,26 +52,34 @@ class BitAxeDeviceAdmin(admin.ModelAdmin):
 
 
 @admin.register(BitAxeMiningStats)
-class BitAxeMiningStatsAdmin(admin.ModelAdmin):
+class BitAxeMiningStatsAdmin(RangeBasedDateHierarchyMixin, admin.ModelAdmin):
     list_display = ('device', 'recorded_at', 'hashrate_ghs', 'shares_accepted', 'shares_rejected', 'blocks_found')
     list_filter = ('device', 'recorded_at')
+    list_select_related = ('device',)
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ('created_at',)
     date_hierarchy = 'recorded_at'
 
 
 @admin.register(BitAxeHardwareLog)
-class BitAxeHardwareLogAdmin(admin.ModelAdmin):
+class BitAxeHardwareLogAdmin(RangeBasedDateHierarchyMixin, admin.ModelAdmin):
     list_display = ('device', 'recorded_at', 'temperature_c', 'power_watts', 'efficiency_j_per_th')
     list_filter = ('device', 'recorded_at')
+    list_select_related = ('device',)
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ('created_at',)
     date_hierarchy = 'recorded_at'
 
 
 @admin.register(BitAxePoolStats)
-class BitAxePoolStatsAdmin(admin.ModelAdmin):
+class BitAxePoolStatsAdmin(RangeBasedDateHierarchyMixin, admin.ModelAdmin):
     list_display = ('pool_address', 'recorded_at', 'hashrate_1m', 'hashrate_1d', 'workers', 'shares', 'bestshare')
     list_filter = ('recorded_at', 'pool_address')
     search_fields = ('pool_address',)
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ('hashrate_1m_ghs', 'hashrate_1d_ghs')
     date_hierarchy = 'recorded_at'
 
@@ -50,10 +98,13 @@ class BitAxePoolStatsAdmin(admin.ModelAdmin):
 
 
 @admin.register(BitAxeSystemInfo)
-class BitAxeSystemInfoAdmin(admin.ModelAdmin):
+class BitAxeSystemInfoAdmin(RangeBasedDateHierarchyMixin, admin.ModelAdmin):
     list_display = ('device', 'recorded_at', 'hostname', 'asic_model', 'version', 'wifi_status')
     list_filter = ('device', 'recorded_at', 'asic_model')
     search_fields = ('hostname', 'mac_address', 'ssid')
+    list_select_related = ('device',)
+    list_per_page = 50
+    show_full_result_count = False
     readonly_fields = ('created_at',)
     date_hierarchy = 'recorded_at'
 
@@ -139,9 +190,15 @@ class CollectorSettingsAdmin(admin.ModelAdmin):
         }),
     )
 
+    # Cached existence flag: the singleton can only flip from absent to
+    # present (delete() is a no-op), so once True we never query again.
+    _settings_exist = False
+
     def has_add_permission(self, request):
         """Prevent adding more than one settings instance."""
-        return not CollectorSettings.objects.exists()
+        if not CollectorSettingsAdmin._settings_exist:
+            CollectorSettingsAdmin._settings_exist = CollectorSettings.objects.exists()
+        return not CollectorSettingsAdmin._settings_exist
 
     def has_delete_permission(self, request, obj=None):
         """Prevent deletion of settings."""
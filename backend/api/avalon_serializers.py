@@ -8,14 +8,18 @@ from .models import AvalonDevice, AvalonHardwareLogs, AvalonMiningStats, AvalonS
 
 
 class AvalonDeviceSerializer(serializers.ModelSerializer):
-    """Serializer for Avalon device registry."""
+    """Serializer for Avalon device registry.
+
+    The unbounded error_message text stays detail-only (see
+    AvalonDeviceDetailSerializer) so list payloads stay bounded.
+    """
 
     class Meta:
         model = AvalonDevice
-        fields = [
+        fields = (
             'id', 'device_id', 'device_name', 'ip_address',
-            'is_active', 'last_seen_at', 'error_message', 'created_at'
-        ]
+            'is_active', 'last_seen_at', 'created_at'
+        )
 
 
 class AvalonMiningStatsSerializer(serializers.ModelSerializer):
@@ -25,12 +29,12 @@ class AvalonMiningStatsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AvalonMiningStats
-        fields = [
+        fields = (
             'id', 'device', 'device_name', 'device_id', 'recorded_at',
             'hashrate_ghs', 'shares_accepted', 'shares_rejected',
             'blocks_found', 'uptime_seconds', 'difficulty',
             'pool_url', 'pool_user', 'created_at'
-        ]
+        )
 
 
 class AvalonHardwareLogsSerializer(serializers.ModelSerializer):
@@ -40,11 +44,11 @@ class AvalonHardwareLogsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AvalonHardwareLogs
-        fields = [
+        fields = (
             'id', 'device', 'device_name', 'device_id', 'recorded_at',
             'power_watts', 'efficiency_j_per_th', 'temperature_c',
             'fan_speed_rpm', 'voltage', 'frequency_mhz', 'created_at'
-        ]
+        )
 
 
 class AvalonSystemInfoSerializer(serializers.ModelSerializer):
@@ -54,7 +58,7 @@ class AvalonSystemInfoSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AvalonSystemInfo
-        fields = [
+        fields = (
             'id', 'device', 'device_name', 'device_id', 'recorded_at',
             'device_model', 'firmware_version', 'hardware_version',
             'serial_number', 'mac_address', 'ip_address', 'hostname',
@@ -63,7 +67,7 @@ class AvalonSystemInfoSerializer(serializers.ModelSerializer):
             'active_pool', 'system_uptime_seconds', 'memory_usage_percent',
             'storage_usage_percent', 'target_frequency', 'target_voltage',
             'auto_tune_enabled', 'created_at'
-        ]
+        )
 
 
 class AvalonDeviceDetailSerializer(serializers.ModelSerializer):
@@ -74,29 +78,40 @@ class AvalonDeviceDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AvalonDevice
-        fields = [
+        fields = (
             'id', 'device_id', 'device_name', 'ip_address',
             'is_active', 'last_seen_at', 'error_message', 'created_at',
             'latest_mining_stats', 'latest_hardware_logs', 'latest_system_info'
-        ]
+        )
+
+    @staticmethod
+    def _latest(obj, cache_attr, manager_name):
+        """Return the newest related row, using the prefetched cache attribute
+        when the view attached one (see `_latest_related_prefetches`) and
+        falling back to a per-device query otherwise.
+        """
+        cached = getattr(obj, cache_attr, None)
+        if cached is not None:
+            return cached[0] if cached else None
+        return getattr(obj, manager_name).first()
 
     def get_latest_mining_stats(self, obj):
         """Get the latest mining statistics for this device."""
-        latest_stats = obj.mining_stats.first()
+        latest_stats = self._latest(obj, '_latest_mining', 'mining_stats')
         if latest_stats:
             return AvalonMiningStatsSerializer(latest_stats).data
         return None
 
     def get_latest_hardware_logs(self, obj):
         """Get the latest hardware logs for this device."""
-        latest_logs = obj.hardware_logs.first()
+        latest_logs = self._latest(obj, '_latest_hardware', 'hardware_logs')
         if latest_logs:
             return AvalonHardwareLogsSerializer(latest_logs).data
         return None
 
     def get_latest_system_info(self, obj):
         """Get the latest system info for this device."""
-        latest_info = obj.system_info.first()
+        latest_info = self._latest(obj, '_latest_system', 'system_info')
         if latest_info:
             return AvalonSystemInfoSerializer(latest_info).data
         return None
@@ -3,10 +3,14 @@ Avalon Nano 3s API views for Django REST Framework
 """
 
 import logging
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-import pandas as pd
-from django.db.models import Avg, Count, Max, Sum
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db.models import Avg, Count, Max, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.functions import TruncHour, TruncMinute
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
@@ -17,14 +21,103 @@ from .avalon_serializers import (
     AvalonDashboardStatsSerializer,
     AvalonDeviceDetailSerializer,
     AvalonDeviceSerializer,
-    AvalonHardwareLogsSerializer,
-    AvalonMiningStatsSerializer,
     AvalonSystemInfoSerializer,
 )
 from .models import AvalonDevice, AvalonHardwareLogs, AvalonMiningStats, AvalonSystemInfo
 
 logger = logging.getLogger(__name__)
 
+# Bounded pool for device restart commands: a slow or offline miner holds a
+# request worker for at most the socket timeout, and bulk restarts run in
+# parallel instead of serially.
+_restart_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='avalon-restart')
+
+RESTART_SOCKET_TIMEOUT = 2.0
+
+# Aggregate maps for the trend endpoints, built once at import so every
+# request reuses the same expression objects instead of reconstructing them.
+# (annotate() resolves a copy, so sharing these across queries is safe.)
+_HASHRATE_TREND_AGGREGATES = {'avg_hashrate': Avg('hashrate_ghs')}
+_TEMPERATURE_TREND_AGGREGATES = {
+    'avg_temperature': Avg('temperature_c'),
+    'avg_power': Avg('power_watts'),
+}
+
+
+def _clamped_int(value, default, lo, hi):
+    """Parse a query parameter as an int bounded to [lo, hi].
+
+    Falls back to the default on missing or malformed input instead of
+    raising, and the upper bound keeps a single request from asking for an
+    unbounded number of rows or buckets.
+    """
+    try:
+        return max(lo, min(hi, int(value)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _send_restart_command(ip):
+    """Send restart command to a miner via the cgminer API socket."""
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(RESTART_SOCKET_TIMEOUT)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.connect((ip, 4028))
+        sock.send(b"ascset|0,reboot,0")
+        response = sock.recv(1024)
+        sock.close()
+        return b'STATUS=S' in response
+    except Exception as e:
+        logger.error(f"Error sending restart command: {e}")
+        return False
+
+
+def _bucketed_trend(query, interval, aggregates):
+    """Aggregate a device time-series queryset into per-device time buckets.
+
+    Annotates a TruncHour/TruncMinute bucket (chosen from the interval in
+    minutes), groups by bucket and device, and applies the given aggregate
+    annotations. Yields row dicts ordered by bucket, each carrying a
+    ready-made ISO 'timestamp' string: consecutive rows share a bucket (one
+    row per device), so the string is formatted once per bucket rather than
+    once per row.
+    """
+    trunc = TruncHour if interval >= 60 else TruncMinute
+    rows = query.annotate(bucket=trunc('recorded_at')).values(
+        'bucket', 'device__device_id', 'device__device_name'
+    ).annotate(**aggregates).order_by(
+        'bucket', 'device__device_id'
+    ).iterator(chunk_size=2000)
+
+    last_bucket = None
+    bucket_iso = None
+    for row in rows:
+        if row['bucket'] != last_bucket:
+            last_bucket = row['bucket']
+            bucket_iso = last_bucket.isoformat()
+        row['timestamp'] = bucket_iso
+        yield row
+
+
+def _latest_related_prefetches():
+    """Build Prefetch objects that attach only the most recent mining stats,
+    hardware log and system info row per device (as `_latest_mining`,
+    `_latest_hardware` and `_latest_system`), so the detail serializer can
+    read them without issuing three queries per device.
+    """
+    def latest_per_device(model):
+        newest = model.objects.filter(
+            device=OuterRef('device')
+        ).order_by('-recorded_at').values('pk')[:1]
+        return model.objects.filter(pk=Subquery(newest)).select_related('device')
+
+    return (
+        Prefetch('mining_stats', queryset=latest_per_device(AvalonMiningStats), to_attr='_latest_mining'),
+        Prefetch('hardware_logs', queryset=latest_per_device(AvalonHardwareLogs), to_attr='_latest_hardware'),
+        Prefetch('system_info', queryset=latest_per_device(AvalonSystemInfo), to_attr='_latest_system'),
+    )
+
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -33,54 +126,87 @@ def avalon_dashboard_stats(request):
     Get Avalon dashboard statistics including device status and aggregated metrics.
     """
     try:
-        # Get all devices with their latest data
-        devices = AvalonDevice.objects.all()
-
-        # Count devices by status
-        total_devices = devices.count()
-        online_devices = devices.filter(is_active=True).count()
+        # The dashboard is identical for every user until the collector writes
+        # new rows, so cache the serialized payload keyed on cheap data
+        # watermarks: new stats or device changes produce a new key, and the
+        # short TTL bounds staleness for in-place device edits.
+        mining_watermark = AvalonMiningStats.objects.aggregate(latest=Max('recorded_at'))['latest']
+        hardware_watermark = AvalonHardwareLogs.objects.aggregate(latest=Max('recorded_at'))['latest']
+        # One aggregate per table: the device pass doubles as the cache
+        # watermark and the status counts, so no separate count() queries.
+        device_agg = AvalonDevice.objects.aggregate(
+            total=Count('id'),
+            online=Count('id', filter=Q(is_active=True)),
+            latest=Max('created_at'),
+        )
+        cache_key = 'avalon_dashboard_stats_v1:{}:{}:{}:{}'.format(
+            mining_watermark, hardware_watermark,
+            device_agg['total'], device_agg['latest'],
+        )
+        cached_data = cache.get(cache_key)
+        if cached_data is not None:
+            return Response(cached_data)
+
+        # Get all devices, fetching only the columns the serializer needs
+        devices = AvalonDevice.objects.only(
+            'id', 'device_id', 'device_name', 'ip_address',
+            'is_active', 'last_seen_at', 'error_message', 'created_at'
+        ).prefetch_related(*_latest_related_prefetches())
+
+        # Device counts come from the aggregate above
+        total_devices = device_agg['total']
+        online_devices = device_agg['online']
         offline_devices = total_devices - online_devices
 
-        # Get latest mining stats for aggregation
-        latest_stats = []
-        latest_hardware = []
-
-        for device in devices:
-            latest_mining = device.mining_stats.first()
-            latest_hw = device.hardware_logs.first()
-
-            if latest_mining:
-                latest_stats.append(latest_mining)
-            if latest_hw:
-                latest_hardware.append(latest_hw)
+        # Aggregate over the latest row per device in SQL instead of looping
+        # over devices and issuing two queries each (N+1).
+        latest_mining_ids = AvalonMiningStats.objects.filter(
+            device=OuterRef('pk')
+        ).order_by('-recorded_at').values('pk')[:1]
+        latest_hardware_ids = AvalonHardwareLogs.objects.filter(
+            device=OuterRef('pk')
+        ).order_by('-recorded_at').values('pk')[:1]
+
+        mining_agg = AvalonMiningStats.objects.filter(
+            id__in=AvalonDevice.objects.annotate(
+                latest_mining=Subquery(latest_mining_ids)
+            ).values('latest_mining')
+        ).aggregate(
+            total_hashrate=Sum('hashrate_ghs'),
+            total_accepted=Sum('shares_accepted'),
+            total_rejected=Sum('shares_rejected'),
+        )
 
-        # Calculate aggregated metrics
-        total_hashrate = sum(stat.hashrate_ghs for stat in latest_stats)
-        avg_temperature = sum(hw.temperature_c for hw in latest_hardware) / len(latest_hardware) if latest_hardware else 0
-        total_power = sum(hw.power_watts for hw in latest_hardware)
-        avg_efficiency = sum(hw.efficiency_j_per_th for hw in latest_hardware) / len(latest_hardware) if latest_hardware else 0
-        total_accepted = sum(stat.shares_accepted for stat in latest_stats)
-        total_rejected = sum(stat.shares_rejected for stat in latest_stats)
+        hardware_agg = AvalonHardwareLogs.objects.filter(
+            id__in=AvalonDevice.objects.annotate(
+                latest_hardware=Subquery(latest_hardware_ids)
+            ).values('latest_hardware')
+        ).aggregate(
+            avg_temperature=Avg('temperature_c'),
+            total_power=Sum('power_watts'),
+            avg_efficiency=Avg('efficiency_j_per_th'),
+        )
 
         # Prepare response data
         dashboard_data = {
             'total_devices': total_devices,
             'online_devices': online_devices,
             'offline_devices': offline_devices,
-            'total_hashrate_ghs': total_hashrate,
-            'average_temperature': avg_temperature,
-            'total_power_watts': total_power,
-            'average_efficiency': avg_efficiency,
-            'total_shares_accepted': total_accepted,
-            'total_shares_rejected': total_rejected,
+            'total_hashrate_ghs': mining_agg['total_hashrate'] or 0,
+            'average_temperature': hardware_agg['avg_temperature'] or 0,
+            'total_power_watts': hardware_agg['total_power'] or 0,
+            'average_efficiency': hardware_agg['avg_efficiency'] or 0,
+            'total_shares_accepted': mining_agg['total_accepted'] or 0,
+            'total_shares_rejected': mining_agg['total_rejected'] or 0,
             'devices': devices
         }
 
         serializer = AvalonDashboardStatsSerializer(dashboard_data)
+        cache.set(cache_key, serializer.data, timeout=60)
         return Response(serializer.data)
 
-    except Exception as e:
-        logger.error(f"Error getting Avalon dashboard stats: {e}", exc_info=True)
+    except DatabaseError as e:
+        logger.error(f"Error getting Avalon dashboard stats: {e}")
         return Response(
             {'error': 'Failed to get dashboard statistics'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -96,7 +222,7 @@ def avalon_devices(request):
     """
     try:
         if request.method == 'GET':
-            devices = AvalonDevice.objects.all().order_by('device_id')
+            devices = AvalonDevice.objects.light().order_by('device_id')
             serializer = AvalonDeviceSerializer(devices, many=True)
             return Response(serializer.data)
 
@@ -107,8 +233,8 @@ def avalon_devices(request):
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    except Exception as e:
-        logger.error(f"Error with Avalon devices: {e}", exc_info=True)
+    except DatabaseError as e:
+        logger.error(f"Error with Avalon devices: {e}")
         return Response(
             {'error': 'Failed to process device request'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -124,17 +250,21 @@ def avalon_device_detail(request, device_id):
     DELETE: Delete an Avalon device.
     """
     try:
-        # Try to find by device_id first, then by pk (id)
+        # Match by device_id or, for numeric identifiers, by pk — one query
+        # instead of a get() miss followed by a second lookup.
+        lookup = Q(device_id=device_id)
         try:
-            device = AvalonDevice.objects.get(device_id=device_id)
-        except AvalonDevice.DoesNotExist:
-            try:
-                device = AvalonDevice.objects.get(pk=int(device_id))
-            except (AvalonDevice.DoesNotExist, ValueError):
-                return Response(
-                    {'error': 'Device not found'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
+            lookup |= Q(pk=int(device_id))
+        except ValueError:
+            pass
+        device = AvalonDevice.objects.prefetch_related(
+            *_latest_related_prefetches()
+        ).filter(lookup).first()
+        if device is None:
+            return Response(
+                {'error': 'Device not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
 
         if request.method == 'GET':
             serializer = AvalonDeviceDetailSerializer(device)
@@ -151,8 +281,8 @@ def avalon_device_detail(request, device_id):
             device.delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
 
-    except Exception as e:
-        logger.error(f"Error with Avalon device detail: {e}", exc_info=True)
+    except DatabaseError as e:
+        logger.error(f"Error with Avalon device detail: {e}")
         return Response(
             {'error': 'Failed to process device request'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -172,14 +302,13 @@ def avalon_mining_stats(request):
     """
     try:
         device_id = request.GET.get('device_id')
-        hours = int(request.GET.get('hours', 24))
-        limit = int(request.GET.get('limit', 100))
+        hours = _clamped_int(request.GET.get('hours'), 24, 1, 24 * 30)
+        limit = _clamped_int(request.GET.get('limit'), 100, 1, 1000)
 
         # Calculate time range
         end_time = timezone.now()
         start_time = end_time - timedelta(hours=hours)
 
-        # Build query
         query = AvalonMiningStats.objects.filter(
             recorded_at__gte=start_time,
             recorded_at__lte=end_time
@@ -188,12 +317,42 @@ def avalon_mining_stats(request):
         if device_id:
             query = query.filter(device__device_id=device_id)
 
-        stats = query.order_by('-recorded_at')[:limit]
-        serializer = AvalonMiningStatsSerializer(stats, many=True)
-        return Response(serializer.data)
-
-    except Exception as e:
-        logger.error(f"Error getting Avalon mining stats: {e}", exc_info=True)
+        # values() + plain dict construction: at up to `limit` rows per call,
+        # skipping per-row ModelSerializer dispatch is a measurable win. The
+        # join pulls device_name/device_id in the same query.
+        rows = query.order_by('-recorded_at').values(
+            'id', 'device', 'recorded_at', 'hashrate_ghs',
+            'shares_accepted', 'shares_rejected', 'blocks_found',
+            'uptime_seconds', 'difficulty', 'pool_url', 'pool_user', 'created_at',
+            'device__device_id', 'device__device_name'
+        )[:limit]
+        return Response([
+            {
+                'id': row['id'],
+                'device': row['device'],
+                'device_name': row['device__device_name'],
+                'device_id': row['device__device_id'],
+                'recorded_at': row['recorded_at'],
+                'hashrate_ghs': row['hashrate_ghs'],
+                'shares_accepted': row['shares_accepted'],
+                'shares_rejected': row['shares_rejected'],
+                'blocks_found': row['blocks_found'],
+                'uptime_seconds': row['uptime_seconds'],
+                'difficulty': row['difficulty'],
+                'pool_url': row['pool_url'],
+                'pool_user': row['pool_user'],
+                'created_at': row['created_at'],
+            }
+            for row in rows
+        ])
+
+    except (ValueError, TypeError):
+        return Response(
+            {'error': 'Invalid query parameters'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except DatabaseError as e:
+        logger.error(f"Error getting Avalon mining stats: {e}")
         return Response(
             {'error': 'Failed to get mining statistics'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -213,14 +372,13 @@ def avalon_hardware_logs(request):
     """
     try:
         device_id = request.GET.get('device_id')
-        hours = int(request.GET.get('hours', 24))
-        limit = int(request.GET.get('limit', 100))
+        hours = _clamped_int(request.GET.get('hours'), 24, 1, 24 * 30)
+        limit = _clamped_int(request.GET.get('limit'), 100, 1, 1000)
 
         # Calculate time range
         end_time = timezone.now()
         start_time = end_time - timedelta(hours=hours)
 
-        # Build query
         query = AvalonHardwareLogs.objects.filter(
             recorded_at__gte=start_time,
             recorded_at__lte=end_time
@@ -229,12 +387,38 @@ def avalon_hardware_logs(request):
         if device_id:
             query = query.filter(device__device_id=device_id)
 
-        logs = query.order_by('-recorded_at')[:limit]
-        serializer = AvalonHardwareLogsSerializer(logs, many=True)
-        return Response(serializer.data)
-
-    except Exception as e:
-        logger.error(f"Error getting Avalon hardware logs: {e}", exc_info=True)
+        # values() + plain dict construction (see avalon_mining_stats)
+        rows = query.order_by('-recorded_at').values(
+            'id', 'device', 'recorded_at', 'power_watts',
+            'efficiency_j_per_th', 'temperature_c', 'fan_speed_rpm',
+            'voltage', 'frequency_mhz', 'created_at',
+            'device__device_id', 'device__device_name'
+        )[:limit]
+        return Response([
+            {
+                'id': row['id'],
+                'device': row['device'],
+                'device_name': row['device__device_name'],
+                'device_id': row['device__device_id'],
+                'recorded_at': row['recorded_at'],
+                'power_watts': row['power_watts'],
+                'efficiency_j_per_th': row['efficiency_j_per_th'],
+                'temperature_c': row['temperature_c'],
+                'fan_speed_rpm': row['fan_speed_rpm'],
+                'voltage': row['voltage'],
+                'frequency_mhz': row['frequency_mhz'],
+                'created_at': row['created_at'],
+            }
+            for row in rows
+        ])
+
+    except (ValueError, TypeError):
+        return Response(
+            {'error': 'Invalid query parameters'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except DatabaseError as e:
+        logger.error(f"Error getting Avalon hardware logs: {e}")
         return Response(
             {'error': 'Failed to get hardware logs'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -254,8 +438,8 @@ def avalon_hashrate_trends(request):
     """
     try:
         device_id = request.GET.get('device_id')
-        hours = int(request.GET.get('hours', 24))
-        interval = int(request.GET.get('interval', 60))
+        hours = _clamped_int(request.GET.get('hours'), 24, 1, 24 * 30)
+        interval = _clamped_int(request.GET.get('interval'), 60, 1, 1440)
 
         # Calculate time range
         end_time = timezone.now()
@@ -270,41 +454,29 @@ def avalon_hashrate_trends(request):
         if device_id:
             query = query.filter(device__device_id=device_id)
 
-        # Get data and convert to DataFrame for easier processing
-        stats = query.order_by('recorded_at').values(
-            'recorded_at', 'hashrate_ghs', 'device__device_id', 'device__device_name'
-        )
+        # Group by time bucket and device in SQL so the DB returns the
+        # already-aggregated series instead of every raw row.
+        rows = _bucketed_trend(query, interval, _HASHRATE_TREND_AGGREGATES)
 
-        if not stats:
-            return Response([])
-
-        df = pd.DataFrame(stats)
-        df['recorded_at'] = pd.to_datetime(df['recorded_at'])
-
-        # Group by time intervals
-        df.set_index('recorded_at', inplace=True)
-        grouped = df.groupby([
-            pd.Grouper(freq=f'{interval}min'),
-            'device__device_id'
-        ]).agg({
-            'hashrate_ghs': 'mean',
-            'device__device_name': 'first'
-        }).reset_index()
-
-        # Format response
-        trends = []
-        for _, row in grouped.iterrows():
-            trends.append({
-                'timestamp': row['recorded_at'].isoformat(),
+        trends = [
+            {
+                'timestamp': row['timestamp'],
                 'device_id': row['device__device_id'],
                 'device_name': row['device__device_name'],
-                'hashrate_ghs': round(row['hashrate_ghs'], 2)
-            })
+                'hashrate_ghs': round(row['avg_hashrate'], 2)
+            }
+            for row in rows
+        ]
 
         return Response(trends)
 
-    except Exception as e:
-        logger.error(f"Error getting Avalon hashrate trends: {e}", exc_info=True)
+    except (ValueError, TypeError):
+        return Response(
+            {'error': 'Invalid query parameters'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except DatabaseError as e:
+        logger.error(f"Error getting Avalon hashrate trends: {e}")
         return Response(
             {'error': 'Failed to get hashrate trends'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -319,8 +491,8 @@ def avalon_temperature_trends(request):
     """
     try:
         device_id = request.GET.get('device_id')
-        hours = int(request.GET.get('hours', 24))
-        interval = int(request.GET.get('interval', 60))
+        hours = _clamped_int(request.GET.get('hours'), 24, 1, 24 * 30)
+        interval = _clamped_int(request.GET.get('interval'), 60, 1, 1440)
 
         # Calculate time range
         end_time = timezone.now()
@@ -335,44 +507,29 @@ def avalon_temperature_trends(request):
         if device_id:
             query = query.filter(device__device_id=device_id)
 
-        # Get data and convert to DataFrame
-        logs = query.order_by('recorded_at').values(
-            'recorded_at', 'temperature_c', 'power_watts',
-            'device__device_id', 'device__device_name'
-        )
+        # Group by time bucket and device in SQL (see avalon_hashrate_trends)
+        rows = _bucketed_trend(query, interval, _TEMPERATURE_TREND_AGGREGATES)
 
-        if not logs:
-            return Response([])
-
-        df = pd.DataFrame(logs)
-        df['recorded_at'] = pd.to_datetime(df['recorded_at'])
-
-        # Group by time intervals
-        df.set_index('recorded_at', inplace=True)
-        grouped = df.groupby([
-            pd.Grouper(freq=f'{interval}min'),
-            'device__device_id'
-        ]).agg({
-            'temperature_c': 'mean',
-            'power_watts': 'mean',
-            'device__device_name': 'first'
-        }).reset_index()
-
-        # Format response
-        trends = []
-        for _, row in grouped.iterrows():
-            trends.append({
-                'timestamp': row['recorded_at'].isoformat(),
+        trends = [
+            {
+                'timestamp': row['timestamp'],
                 'device_id': row['device__device_id'],
                 'device_name': row['device__device_name'],
-                'temperature_c': round(row['temperature_c'], 1),
-                'power_watts': round(row['power_watts'], 1)
-            })
+                'temperature_c': round(row['avg_temperature'], 1),
+                'power_watts': round(row['avg_power'], 1)
+            }
+            for row in rows
+        ]
 
         return Response(trends)
 
-    except Exception as e:
-        logger.error(f"Error getting Avalon temperature trends: {e}", exc_info=True)
+    except (ValueError, TypeError):
+        return Response(
+            {'error': 'Invalid query parameters'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    except DatabaseError as e:
+        logger.error(f"Error getting Avalon temperature trends: {e}")
         return Response(
             {'error': 'Failed to get temperature trends'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -388,24 +545,18 @@ def avalon_restart_device(request, device_id):
     try:
         device = AvalonDevice.objects.get(device_id=device_id)
 
-        # Import socket for direct communication
-        import socket
-
-        def send_restart_command(ip):
-            """Send restart command via socket."""
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(10)
-                sock.connect((ip, 4028))
-                sock.send(b"ascset|0,reboot,0")
-                response = sock.recv(1024)
-                sock.close()
-                return b'STATUS=S' in response
-            except Exception as e:
-                logger.error(f"Error sending restart command: {e}")
-                return False
-
-        success = send_restart_command(device.ip_address)
+        # Run the socket I/O on the bounded executor so concurrent restarts
+        # do not pile up on request workers. With ?wait=0 the command is
+        # queued fire-and-forget and the request returns immediately.
+        future = _restart_executor.submit(_send_restart_command, device.ip_address)
+
+        if request.GET.get('wait', '1') in ('0', 'false'):
+            return Response(
+                {'message': f'Restart command queued for {device.device_name}'},
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        success = future.result()
 
         if success:
             return Response({'message': f'Restart command sent to {device.device_name}'})
@@ -420,8 +571,8 @@ def avalon_restart_device(request, device_id):
             {'error': 'Device not found'},
             status=status.HTTP_404_NOT_FOUND
         )
-    except Exception as e:
-        logger.error(f"Error restarting Avalon device: {e}", exc_info=True)
+    except DatabaseError as e:
+        logger.error(f"Error restarting Avalon device: {e}")
         return Response(
             {'error': 'Failed to restart device'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -0,0 +1,42 @@
+# Generated migration for descending recorded_at indexes on time-series tables
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_add_discord_settings'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='collectorsettings',
+            name='discord_enabled',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='avalonhardwarelogs',
+            index=models.Index(fields=['-recorded_at'], name='avalon_hard_recorde_e5e6e7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='avalonminingstats',
+            index=models.Index(fields=['-recorded_at'], name='avalon_mini_recorde_fe87c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='avalonsysteminfo',
+            index=models.Index(fields=['-recorded_at'], name='avalon_syst_recorde_22b086_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bitaxehardwarelog',
+            index=models.Index(fields=['-recorded_at'], name='bitaxe_hard_recorde_bbc0b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bitaxeminingstats',
+            index=models.Index(fields=['-recorded_at'], name='bitaxe_mini_recorde_52166a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bitaxesysteminfo',
+            index=models.Index(fields=['-recorded_at'], name='bitaxe_syst_recorde_397074_idx'),
+        ),
+    ]
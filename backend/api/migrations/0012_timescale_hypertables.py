@@ -0,0 +1,73 @@
+# Convert the append-only BitAxe time-series tables to TimescaleDB
+# hypertables with compression and retention policies.
+#
+# Everything runs inside a DO block guarded on the timescaledb extension, so
+# deployments on plain Postgres (and the migration-less test database) are
+# untouched. Hypertables require every unique constraint to include the
+# partition column, so each table's id-only primary key is recreated as
+# (id, recorded_at) first; Django keeps addressing rows by id.
+
+from django.db import migrations
+
+
+def _hypertable_sql(table, segment_by, compress_after="14 days"):
+    return f"""
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_pkey;
+        ALTER TABLE {table} ADD PRIMARY KEY (id, recorded_at);
+        PERFORM create_hypertable(
+            '{table}', 'recorded_at',
+            chunk_time_interval => INTERVAL '7 days',
+            migrate_data => TRUE,
+            if_not_exists => TRUE
+        );
+        ALTER TABLE {table} SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = '{segment_by}',
+            timescaledb.compress_orderby = 'recorded_at DESC'
+        );
+        PERFORM add_compression_policy(
+            '{table}', INTERVAL '{compress_after}', if_not_exists => TRUE
+        );
+    END IF;
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_add_recorded_at_desc_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            _hypertable_sql('bitaxe_mining_stats', 'device_id'),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            _hypertable_sql('bitaxe_hardware_logs', 'device_id'),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            _hypertable_sql('bitaxe_pool_stats', 'pool_address'),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        PERFORM add_retention_policy(
+            'bitaxe_hardware_logs', INTERVAL '1 year', if_not_exists => TRUE
+        );
+    END IF;
+END
+$$;
+""",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
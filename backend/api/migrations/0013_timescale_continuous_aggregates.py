@@ -0,0 +1,113 @@
+# Continuous aggregates over the BitAxe hypertables, plus unmanaged models
+# mapping them for the ORM. Trend queries against the aggregates read
+# O(buckets) rows instead of scanning the raw series.
+#
+# Like 0012, all SQL is guarded on the timescaledb extension and no-ops
+# elsewhere. The views are created WITH NO DATA (required inside a
+# transaction); the refresh policies backfill and keep them current.
+
+from django.db import migrations, models
+
+
+def _cagg_sql(view, source, width, select_cols, group_cols='device_id'):
+    return f"""
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+        EXECUTE 'CREATE MATERIALIZED VIEW IF NOT EXISTS {view}
+            WITH (timescaledb.continuous) AS
+            SELECT {group_cols},
+                   time_bucket(INTERVAL ''{width}'', recorded_at) AS bucket,
+                   {select_cols}
+            FROM {source}
+            GROUP BY {group_cols}, bucket
+            WITH NO DATA';
+        PERFORM add_continuous_aggregate_policy(
+            '{view}',
+            start_offset => INTERVAL '2 days',
+            end_offset => INTERVAL '{width}',
+            schedule_interval => INTERVAL '{width}',
+            if_not_exists => TRUE
+        );
+    END IF;
+END
+$$;
+"""
+
+
+_MINING_COLS = "avg(hashrate_ghs) AS hashrate_ghs, sum(shares_accepted) AS shares_accepted"
+_HARDWARE_COLS = "avg(temperature_c) AS temperature_c, avg(power_watts) AS power_watts"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_timescale_hypertables'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BitAxeHardwareLog1d',
+            fields=[
+                ('bucket', models.DateTimeField(primary_key=True, serialize=False)),
+                ('temperature_c', models.FloatField()),
+                ('power_watts', models.FloatField()),
+            ],
+            options={
+                'db_table': 'bitaxe_hardware_logs_1d',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='BitAxeHardwareLog1h',
+            fields=[
+                ('bucket', models.DateTimeField(primary_key=True, serialize=False)),
+                ('temperature_c', models.FloatField()),
+                ('power_watts', models.FloatField()),
+            ],
+            options={
+                'db_table': 'bitaxe_hardware_logs_1h',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='BitAxeMiningStats1h',
+            fields=[
+                ('bucket', models.DateTimeField(primary_key=True, serialize=False)),
+                ('hashrate_ghs', models.FloatField()),
+                ('shares_accepted', models.BigIntegerField()),
+            ],
+            options={
+                'db_table': 'bitaxe_mining_stats_1h',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='BitAxeMiningStats5m',
+            fields=[
+                ('bucket', models.DateTimeField(primary_key=True, serialize=False)),
+                ('hashrate_ghs', models.FloatField()),
+                ('shares_accepted', models.BigIntegerField()),
+            ],
+            options={
+                'db_table': 'bitaxe_mining_stats_5m',
+                'managed': False,
+            },
+        ),
+        migrations.RunSQL(
+            _cagg_sql('bitaxe_mining_stats_5m', 'bitaxe_mining_stats', '5 minutes', _MINING_COLS),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            _cagg_sql('bitaxe_mining_stats_1h', 'bitaxe_mining_stats', '1 hour', _MINING_COLS),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            _cagg_sql('bitaxe_hardware_logs_1h', 'bitaxe_hardware_logs', '1 hour', _HARDWARE_COLS),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            _cagg_sql('bitaxe_hardware_logs_1d', 'bitaxe_hardware_logs', '1 day', _HARDWARE_COLS),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
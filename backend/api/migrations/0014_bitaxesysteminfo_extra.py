@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_timescale_continuous_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bitaxesysteminfo',
+            name='extra',
+            field=models.JSONField(blank=True, db_default='{}', default=dict),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_bitaxesysteminfo_extra'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='bitaxehardwarelog',
+            name='bitaxe_hard_device__f67a33_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='bitaxeminingstats',
+            name='bitaxe_mini_device__cdbd9e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='bitaxehardwarelog',
+            index=models.Index(fields=['device', '-recorded_at'], include=('temperature_c', 'power_watts'), name='bitaxe_hw_dev_time_cov'),
+        ),
+        migrations.AddIndex(
+            model_name='bitaxeminingstats',
+            index=models.Index(fields=['device', '-recorded_at'], include=('hashrate_ghs', 'shares_accepted'), name='bitaxe_mining_dev_time_cov'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bitaxepoolstats',
+            name='hashrate_1hr_ghs',
+            field=models.FloatField(blank=True, help_text='1hr hashrate converted to GH/s', null=True),
+        ),
+        migrations.AddField(
+            model_name='bitaxepoolstats',
+            name='hashrate_5m_ghs',
+            field=models.FloatField(blank=True, help_text='5m hashrate converted to GH/s', null=True),
+        ),
+        migrations.AddField(
+            model_name='bitaxepoolstats',
+            name='hashrate_7d_ghs',
+            field=models.FloatField(blank=True, help_text='7d hashrate converted to GH/s', null=True),
+        ),
+    ]
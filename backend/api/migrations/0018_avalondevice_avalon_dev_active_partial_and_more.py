@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_alter_avalonhardwarelogs_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='avalondevice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='avalon_dev_active_partial'),
+        ),
+        migrations.AddIndex(
+            model_name='avalondevice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['last_seen_at'], name='avalon_dev_seen_partial'),
+        ),
+        migrations.AddIndex(
+            model_name='bitaxedevice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='bitaxe_dev_active_partial'),
+        ),
+        migrations.AddIndex(
+            model_name='bitaxedevice',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['last_seen_at'], name='bitaxe_dev_seen_partial'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_avalondevice_avalon_dev_active_partial_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collectorsettings',
+            name='version',
+            field=models.IntegerField(default=0, help_text='Bumped on every save; lets cached readers detect staleness cheaply'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.17 on 2026-08-29 02:55
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_collectorsettings_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='avalonhardwarelogs',
+            name='recorded_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='avalonminingstats',
+            name='recorded_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='avalonsysteminfo',
+            name='recorded_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='bitaxehardwarelog',
+            name='recorded_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='bitaxeminingstats',
+            name='recorded_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='bitaxepoolstats',
+            name='recorded_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now()),
+        ),
+        migrations.AlterField(
+            model_name='bitaxesysteminfo',
+            name='recorded_at',
+            field=models.DateTimeField(),
+        ),
+    ]
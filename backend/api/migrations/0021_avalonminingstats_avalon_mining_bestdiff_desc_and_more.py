@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-29 03:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_alter_avalonhardwarelogs_recorded_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='avalonminingstats',
+            index=models.Index(condition=models.Q(('difficulty__gt', 1000)), fields=['-difficulty'], name='avalon_mining_bestdiff_desc'),
+        ),
+        migrations.AddIndex(
+            model_name='bitaxeminingstats',
+            index=models.Index(condition=models.Q(('best_difficulty__gt', 0)), fields=['-best_difficulty'], name='bitaxe_mining_bestdiff_desc'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# NOTIFY the data service when collector settings or device rows change,
+# so its listener reloads on signal instead of polling the tables every
+# few minutes. Plain plpgsql statement-level triggers, no extension
+# required; like the other RunSQL migrations this never runs against the
+# migration-less SQLite test database.
+
+from django.db import migrations
+
+_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION minersentinel_notify_settings_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('settings_changed', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _trigger_sql(table):
+    return f"""
+DROP TRIGGER IF EXISTS {table}_notify_changed ON {table};
+CREATE TRIGGER {table}_notify_changed
+AFTER INSERT OR UPDATE OR DELETE ON {table}
+FOR EACH STATEMENT
+EXECUTE FUNCTION minersentinel_notify_settings_changed();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_avalonminingstats_avalon_mining_bestdiff_desc_and_more'),
+    ]
+
+    operations = [
+        migrations.RunSQL(_FUNCTION_SQL, reverse_sql=migrations.RunSQL.noop),
+        migrations.RunSQL(
+            _trigger_sql('collector_settings'),
+            reverse_sql="DROP TRIGGER IF EXISTS collector_settings_notify_changed ON collector_settings;",
+        ),
+        migrations.RunSQL(
+            _trigger_sql('bitaxe_devices'),
+            reverse_sql="DROP TRIGGER IF EXISTS bitaxe_devices_notify_changed ON bitaxe_devices;",
+        ),
+        migrations.RunSQL(
+            _trigger_sql('avalon_devices'),
+            reverse_sql="DROP TRIGGER IF EXISTS avalon_devices_notify_changed ON avalon_devices;",
+        ),
+    ]
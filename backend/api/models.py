@@ -1,6 +1,30 @@
+import re
+import time
+
 from django.db import models
+from django.db.models.functions import Now
 from django.utils import timezone
 
+# Hashrate string parsing, compiled once: save() and bulk_record() run this
+# per ingested pool-stats row. The GH/s multipliers live in a 32-slot list
+# indexed by ord(unit) & 0x1F, which folds upper and lower case onto the same
+# slot without a per-call .upper() and replaces the dict hash with a plain
+# array index. Slot 0 (no unit) is raw H/s.
+_HASHRATE_RE = re.compile(r'([\d.]+)([KMGTPkmgtp]?)')
+_HASHRATE_UNITS = frozenset('KMGTPkmgtp')
+_HASHRATE_MULTIPLIERS = [1e-9] * 32
+for _unit, _mult in (('K', 1e-6), ('M', 0.001), ('G', 1.0), ('T', 1000.0), ('P', 1000000.0)):
+    _HASHRATE_MULTIPLIERS[ord(_unit) & 0x1F] = _mult
+del _unit, _mult
+
+
+class DeviceQuerySet(models.QuerySet):
+    """Shared queryset for the device registries."""
+
+    def light(self):
+        """Defer the unbounded error_message text for list-style reads."""
+        return self.defer('error_message')
+
 
 class BitAxeDevice(models.Model):
     """Bitaxe device registry."""
@@ -12,8 +36,24 @@ class BitAxeDevice(models.Model):
     error_message = models.TextField(blank=True, null=True, help_text="Last error message if offline")
     created_at = models.DateTimeField(default=timezone.now)
 
+    objects = DeviceQuerySet.as_manager()
+
     class Meta:
         db_table = 'bitaxe_devices'
+        indexes = [
+            # Partial indexes: the collector enumerates active devices every
+            # poll cycle, so keep only the (rare) active rows indexed.
+            models.Index(
+                fields=['is_active'],
+                condition=models.Q(is_active=True),
+                name='bitaxe_dev_active_partial',
+            ),
+            models.Index(
+                fields=['last_seen_at'],
+                condition=models.Q(is_active=True),
+                name='bitaxe_dev_seen_partial',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.device_name} ({self.device_id})"
@@ -22,7 +62,7 @@ class BitAxeDevice(models.Model):
 class BitAxeMiningStats(models.Model):
     """Bitaxe mining statistics."""
     device = models.ForeignKey(BitAxeDevice, on_delete=models.CASCADE, related_name='mining_stats')
-    recorded_at = models.DateTimeField(db_index=True)
+    recorded_at = models.DateTimeField()
     hashrate_ghs = models.FloatField(help_text="Hash rate in GH/s")
     shares_accepted = models.IntegerField()
     shares_rejected = models.IntegerField()
@@ -32,13 +72,34 @@ class BitAxeMiningStats(models.Model):
     best_session_difficulty = models.BigIntegerField(blank=True, null=True, help_text="Current session best difficulty (from API 'bestSessionDiff')")
     pool_url = models.CharField(max_length=255, blank=True, null=True)
     pool_user = models.CharField(max_length=255, blank=True, null=True)
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(db_default=Now())
 
     class Meta:
         db_table = 'bitaxe_mining_stats'
         ordering = ['-recorded_at']
         indexes = [
-            models.Index(fields=['device', '-recorded_at']),
+            # Covering on Postgres: latest-hashrate-per-device queries become
+            # index-only scans. Backends without INCLUDE keep the plain index.
+            models.Index(
+                fields=['device', '-recorded_at'],
+                include=['hashrate_ghs', 'shares_accepted'],
+                name='bitaxe_mining_dev_time_cov',
+            ),
+            models.Index(fields=['-recorded_at']),
+            # Partial: the record-best lookup orders by best_difficulty over
+            # only the rows that carry one.
+            models.Index(
+                fields=['-best_difficulty'],
+                condition=models.Q(best_difficulty__gt=0),
+                name='bitaxe_mining_bestdiff_desc',
+            ),
+            # Partial composite: serves the per-device best-difficulty
+            # GROUP BY in the device comparison.
+            models.Index(
+                fields=['device', '-best_difficulty'],
+                condition=models.Q(best_difficulty__gt=0),
+                name='bitaxe_mining_dev_bestdiff',
+            ),
         ]
 
     def __str__(self):
@@ -48,20 +109,25 @@ class BitAxeMiningStats(models.Model):
 class BitAxeHardwareLog(models.Model):
     """Bitaxe hardware metrics (power, temperature, etc.)."""
     device = models.ForeignKey(BitAxeDevice, on_delete=models.CASCADE, related_name='hardware_logs')
-    recorded_at = models.DateTimeField(db_index=True)
+    recorded_at = models.DateTimeField()
     power_watts = models.FloatField(help_text="Power consumption in Watts")
     efficiency_j_per_th = models.FloatField(blank=True, null=True, help_text="Joules per TeraHash")
     temperature_c = models.FloatField(help_text="Temperature in Celsius")
     fan_speed_rpm = models.IntegerField(blank=True, null=True)
     voltage = models.FloatField(blank=True, null=True)
     frequency_mhz = models.IntegerField(blank=True, null=True)
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(db_default=Now())
 
     class Meta:
         db_table = 'bitaxe_hardware_logs'
         ordering = ['-recorded_at']
         indexes = [
-            models.Index(fields=['device', '-recorded_at']),
+            models.Index(
+                fields=['device', '-recorded_at'],
+                include=['temperature_c', 'power_watts'],
+                name='bitaxe_hw_dev_time_cov',
+            ),
+            models.Index(fields=['-recorded_at']),
         ]
 
     def __str__(self):
@@ -71,7 +137,7 @@ class BitAxeHardwareLog(models.Model):
 class BitAxeSystemInfo(models.Model):
     """Extended Bitaxe system information."""
     device = models.ForeignKey(BitAxeDevice, on_delete=models.CASCADE, related_name='system_info')
-    recorded_at = models.DateTimeField(db_index=True)
+    recorded_at = models.DateTimeField()
 
     # Hardware info
     asic_model = models.CharField(max_length=50, blank=True, null=True)
@@ -130,13 +196,18 @@ class BitAxeSystemInfo(models.Model):
     free_heap = models.BigIntegerField(blank=True, null=True)
     is_psram_available = models.BooleanField(default=False)
 
-    created_at = models.DateTimeField(default=timezone.now)
+    # Catch-all for new firmware fields: lands as JSONB on Postgres, so
+    # future AxeOS additions don't each need a schema migration.
+    extra = models.JSONField(default=dict, db_default='{}', blank=True)
+
+    created_at = models.DateTimeField(db_default=Now())
 
     class Meta:
         db_table = 'bitaxe_system_info'
         ordering = ['-recorded_at']
         indexes = [
             models.Index(fields=['device', '-recorded_at']),
+            models.Index(fields=['-recorded_at']),
         ]
 
     def __str__(self):
@@ -147,7 +218,7 @@ class BitAxeSystemInfo(models.Model):
 class BitAxePoolStats(models.Model):
     """Bitaxe mining pool statistics from CKPool."""
     pool_address = models.CharField(max_length=255, db_index=True, help_text="Bitcoin address or pool username")
-    recorded_at = models.DateTimeField(default=timezone.now, db_index=True)
+    recorded_at = models.DateTimeField(db_default=Now())
 
     # Hashrate data (stored as strings from API, converted for display)
     hashrate_1m = models.CharField(max_length=20, help_text="1 minute hashrate")
@@ -164,9 +235,13 @@ class BitAxePoolStats(models.Model):
     bestever = models.BigIntegerField(help_text="Best ever difficulty")
     authorised = models.BigIntegerField(help_text="Unix timestamp of authorization")
 
-    # Calculated hashrate in GH/s for querying
+    # Calculated hashrate in GH/s for querying: converted once at write time
+    # so analytics can aggregate numerically instead of parsing strings.
     hashrate_1m_ghs = models.FloatField(null=True, blank=True, help_text="1m hashrate converted to GH/s")
+    hashrate_5m_ghs = models.FloatField(null=True, blank=True, help_text="5m hashrate converted to GH/s")
+    hashrate_1hr_ghs = models.FloatField(null=True, blank=True, help_text="1hr hashrate converted to GH/s")
     hashrate_1d_ghs = models.FloatField(null=True, blank=True, help_text="1d hashrate converted to GH/s")
+    hashrate_7d_ghs = models.FloatField(null=True, blank=True, help_text="7d hashrate converted to GH/s")
 
     class Meta:
         db_table = 'bitaxe_pool_stats'
@@ -183,39 +258,120 @@ class BitAxePoolStats(models.Model):
 
     def save(self, *args, **kwargs):
         """Convert hashrate strings to GH/s for easier querying."""
-        self.hashrate_1m_ghs = self._convert_hashrate_to_ghs(self.hashrate_1m)
-        self.hashrate_1d_ghs = self._convert_hashrate_to_ghs(self.hashrate_1d)
+        self._convert_hashrates()
         super().save(*args, **kwargs)
 
+    def _convert_hashrates(self):
+        """Populate any unset numeric GH/s columns from the raw string windows.
+
+        Already-populated values are left alone, so fixture loads and rows
+        passing through save() a second time don't re-parse the strings.
+        """
+        convert = self._convert_hashrate_to_ghs
+        if self.hashrate_1m_ghs is None:
+            self.hashrate_1m_ghs = convert(self.hashrate_1m)
+        if self.hashrate_5m_ghs is None:
+            self.hashrate_5m_ghs = convert(self.hashrate_5m)
+        if self.hashrate_1hr_ghs is None:
+            self.hashrate_1hr_ghs = convert(self.hashrate_1hr)
+        if self.hashrate_1d_ghs is None:
+            self.hashrate_1d_ghs = convert(self.hashrate_1d)
+        if self.hashrate_7d_ghs is None:
+            self.hashrate_7d_ghs = convert(self.hashrate_7d)
+
+    @classmethod
+    def bulk_record(cls, rows, batch_size=500):
+        """Insert many pool-stat rows at once, bypassing per-row save().
+
+        Takes a list of field dicts as collected from the pool API, computes
+        the derived GH/s columns in Python, and writes everything with
+        bulk_create so the collector pays one round trip per batch instead of
+        one per row.
+        """
+        objs = []
+        for row in rows:
+            obj = cls(**row)
+            obj._convert_hashrates()
+            objs.append(obj)
+        return cls.objects.bulk_create(objs, batch_size=batch_size)
+
     @staticmethod
     def _convert_hashrate_to_ghs(hashrate_str):
         """Convert hashrate string (e.g., '466G', '1.29G', '185M') to GH/s float."""
         if not hashrate_str:
             return 0.0
 
-        # Remove whitespace
         hashrate_str = hashrate_str.strip()
+        if not hashrate_str:
+            return 0.0
 
-        # Extract number and unit
-        import re
-        match = re.match(r'([\d.]+)([KMGTP]?)', hashrate_str, re.IGNORECASE)
+        # Fast path: well-formed "<number><unit?>" strings (the usual pool
+        # API shape) need no regex, just a last-char dispatch.
+        unit = hashrate_str[-1]
+        try:
+            if unit in _HASHRATE_UNITS:
+                return float(hashrate_str[:-1]) * _HASHRATE_MULTIPLIERS[ord(unit) & 0x1F]
+            return float(hashrate_str) * 1e-9
+        except ValueError:
+            pass
+
+        match = _HASHRATE_RE.match(hashrate_str)
         if not match:
             return 0.0
 
-        value = float(match.group(1))
-        unit = match.group(2).upper()
+        unit = match.group(2)
+        return float(match.group(1)) * (_HASHRATE_MULTIPLIERS[ord(unit) & 0x1F] if unit else 1e-9)
+
+
+# Read-only mappings over the TimescaleDB continuous aggregates created in
+# migration 0013. They only exist when the timescaledb extension is
+# installed; callers must fall back to the raw tables elsewhere.
+class BitAxeMiningStats5m(models.Model):
+    """5-minute continuous aggregate of BitAxeMiningStats (read-only view)."""
+    bucket = models.DateTimeField(primary_key=True)
+    device = models.ForeignKey(BitAxeDevice, on_delete=models.DO_NOTHING, db_column='device_id', related_name='+')
+    hashrate_ghs = models.FloatField()
+    shares_accepted = models.BigIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'bitaxe_mining_stats_5m'
+
+
+class BitAxeMiningStats1h(models.Model):
+    """Hourly continuous aggregate of BitAxeMiningStats (read-only view)."""
+    bucket = models.DateTimeField(primary_key=True)
+    device = models.ForeignKey(BitAxeDevice, on_delete=models.DO_NOTHING, db_column='device_id', related_name='+')
+    hashrate_ghs = models.FloatField()
+    shares_accepted = models.BigIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'bitaxe_mining_stats_1h'
 
-        # Convert to GH/s
-        multipliers = {
-            '': 1e-9,      # H/s
-            'K': 1e-6,     # KH/s
-            'M': 0.001,    # MH/s
-            'G': 1,        # GH/s
-            'T': 1000,     # TH/s
-            'P': 1000000,  # PH/s
-        }
 
-        return value * multipliers.get(unit, 1)
+class BitAxeHardwareLog1h(models.Model):
+    """Hourly continuous aggregate of BitAxeHardwareLog (read-only view)."""
+    bucket = models.DateTimeField(primary_key=True)
+    device = models.ForeignKey(BitAxeDevice, on_delete=models.DO_NOTHING, db_column='device_id', related_name='+')
+    temperature_c = models.FloatField()
+    power_watts = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'bitaxe_hardware_logs_1h'
+
+
+class BitAxeHardwareLog1d(models.Model):
+    """Daily continuous aggregate of BitAxeHardwareLog (read-only view)."""
+    bucket = models.DateTimeField(primary_key=True)
+    device = models.ForeignKey(BitAxeDevice, on_delete=models.DO_NOTHING, db_column='device_id', related_name='+')
+    temperature_c = models.FloatField()
+    power_watts = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'bitaxe_hardware_logs_1d'
 
 
 # Avalon Nano 3s Models
@@ -229,8 +385,22 @@ class AvalonDevice(models.Model):
     error_message = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
 
+    objects = DeviceQuerySet.as_manager()
+
     class Meta:
         db_table = 'avalon_devices'
+        indexes = [
+            models.Index(
+                fields=['is_active'],
+                condition=models.Q(is_active=True),
+                name='avalon_dev_active_partial',
+            ),
+            models.Index(
+                fields=['last_seen_at'],
+                condition=models.Q(is_active=True),
+                name='avalon_dev_seen_partial',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.device_name} ({self.device_id})"
@@ -239,7 +409,7 @@ class AvalonDevice(models.Model):
 class AvalonMiningStats(models.Model):
     """Avalon Nano 3s mining statistics."""
     device = models.ForeignKey(AvalonDevice, on_delete=models.CASCADE, related_name='mining_stats')
-    recorded_at = models.DateTimeField(db_index=True)
+    recorded_at = models.DateTimeField()
     hashrate_ghs = models.FloatField(help_text="Hashrate in GH/s")
     shares_accepted = models.IntegerField(default=0)
     shares_rejected = models.IntegerField(default=0)
@@ -248,13 +418,28 @@ class AvalonMiningStats(models.Model):
     difficulty = models.FloatField(default=0.0)
     pool_url = models.CharField(max_length=255, blank=True, null=True)
     pool_user = models.CharField(max_length=255, blank=True, null=True)
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(db_default=Now())
 
     class Meta:
         db_table = 'avalon_mining_stats'
         ordering = ['-recorded_at']
         indexes = [
             models.Index(fields=['device', '-recorded_at']),
+            models.Index(fields=['-recorded_at']),
+            # Partial: the record-best lookup only considers meaningful
+            # best shares (see detailed_analytics).
+            models.Index(
+                fields=['-difficulty'],
+                condition=models.Q(difficulty__gt=1000),
+                name='avalon_mining_bestdiff_desc',
+            ),
+            # Partial composite: serves the per-device best-difficulty
+            # GROUP BY in the device comparison.
+            models.Index(
+                fields=['device', '-difficulty'],
+                condition=models.Q(difficulty__gt=1000),
+                name='avalon_mining_dev_bestdiff',
+            ),
         ]
 
     def __str__(self):
@@ -264,20 +449,21 @@ class AvalonMiningStats(models.Model):
 class AvalonHardwareLogs(models.Model):
     """Avalon Nano 3s hardware monitoring data."""
     device = models.ForeignKey(AvalonDevice, on_delete=models.CASCADE, related_name='hardware_logs')
-    recorded_at = models.DateTimeField(db_index=True)
+    recorded_at = models.DateTimeField()
     power_watts = models.FloatField(default=0.0)
     efficiency_j_per_th = models.FloatField(default=0.0, help_text="Power efficiency in J/TH")
     temperature_c = models.FloatField(default=0.0)
     fan_speed_rpm = models.IntegerField(default=0)
     voltage = models.FloatField(default=0.0)
     frequency_mhz = models.FloatField(default=0.0)
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(db_default=Now())
 
     class Meta:
         db_table = 'avalon_hardware_logs'
         ordering = ['-recorded_at']
         indexes = [
             models.Index(fields=['device', '-recorded_at']),
+            models.Index(fields=['-recorded_at']),
         ]
 
     def __str__(self):
@@ -287,7 +473,7 @@ class AvalonHardwareLogs(models.Model):
 class AvalonSystemInfo(models.Model):
     """Avalon Nano 3s extended system information."""
     device = models.ForeignKey(AvalonDevice, on_delete=models.CASCADE, related_name='system_info')
-    recorded_at = models.DateTimeField(db_index=True)
+    recorded_at = models.DateTimeField()
 
     # Device info
     device_model = models.CharField(max_length=100, blank=True, null=True)
@@ -319,13 +505,14 @@ class AvalonSystemInfo(models.Model):
     target_voltage = models.FloatField(default=0.0)
     auto_tune_enabled = models.BooleanField(default=False)
 
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(db_default=Now())
 
     class Meta:
         db_table = 'avalon_system_info'
         ordering = ['-recorded_at']
         indexes = [
             models.Index(fields=['device', '-recorded_at']),
+            models.Index(fields=['-recorded_at']),
         ]
 
     def __str__(self):
@@ -451,6 +638,10 @@ class CollectorSettings(models.Model):
     )
 
     # Metadata
+    version = models.IntegerField(
+        default=0,
+        help_text="Bumped on every save; lets cached readers detect staleness cheaply"
+    )
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(default=timezone.now)
 
@@ -462,10 +653,23 @@ class CollectorSettings(models.Model):
     def __str__(self):
         return f"Collector Settings (updated: {self.updated_at})"
 
+    # In-process cache of the singleton instance. save() drops it so writes
+    # in this process take effect immediately. After the TTL, other workers
+    # revalidate with a single-column version probe and only reload the full
+    # row when the version actually changed.
+    _cached_settings = None
+    _cached_settings_at = 0.0
+    _SETTINGS_CACHE_TTL = 30.0
+
     def save(self, *args, **kwargs):
         """Ensure only one instance exists (singleton pattern)."""
         self.pk = 1
+        if not self._state.adding:
+            self.version = models.F('version') + 1
         super().save(*args, **kwargs)
+        if not isinstance(self.version, int):
+            self.refresh_from_db(fields=['version'])
+        CollectorSettings._cached_settings = None
 
     def delete(self, *args, **kwargs):
         """Prevent deletion of settings - do nothing."""
@@ -473,6 +677,19 @@ class CollectorSettings(models.Model):
 
     @classmethod
     def get_settings(cls):
-        """Get or create the singleton settings instance."""
+        """Get or create the singleton settings instance (cached in-process)."""
+        obj = cls._cached_settings
+        now = time.monotonic()
+        if obj is not None:
+            if now - cls._cached_settings_at < cls._SETTINGS_CACHE_TTL:
+                return obj
+            # TTL expired: probe just the version column before paying for a
+            # full-row reload.
+            current = cls.objects.filter(pk=1).values_list('version', flat=True).first()
+            if current == obj.version:
+                cls._cached_settings_at = now
+                return obj
         obj, created = cls.objects.get_or_create(pk=1)
+        cls._cached_settings = obj
+        cls._cached_settings_at = now
         return obj
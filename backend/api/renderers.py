@@ -0,0 +1,28 @@
+"""
+orjson-backed JSON renderer for the large read-only analytics payloads.
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render response data with orjson instead of the stdlib json module.
+
+    The analytics payloads are nested dicts of already-rounded floats,
+    hour strings and lists — exactly what orjson's C serializer is fast
+    at. OPT_SERIALIZE_NUMPY covers any NumPy scalars that slip through
+    the pandas/NumPy reductions. Views keep returning DRF ``Response``,
+    so permissions, status handling and ``response.data`` in tests are
+    unchanged; only the encode step differs.
+
+    Not a drop-in default: it has no browsable-API form and no indent
+    support, so it is opted into per view with ``@renderer_classes``.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -1,12 +1,30 @@
+from datetime import datetime
+
 from rest_framework import serializers
 
 from .models import AvalonDevice, BitAxeDevice, BitAxeHardwareLog, BitAxeMiningStats, BitAxePoolStats, BitAxeSystemInfo, CollectorSettings
 
 
+def _epoch_to_iso(ts):
+    """Format a Unix timestamp as an ISO datetime string (None if unset)."""
+    if ts:
+        return datetime.fromtimestamp(ts).isoformat()
+    return None
+
+
 class BitAxeDeviceSerializer(serializers.ModelSerializer):
     class Meta:
         model = BitAxeDevice
-        fields = '__all__'
+        fields = (
+            'id', 'device_id', 'device_name', 'ip_address',
+            'is_active', 'last_seen_at', 'created_at'
+        )
+
+
+class BitAxeDeviceDetailSerializer(BitAxeDeviceSerializer):
+    """Adds the unbounded error_message text for single-device reads."""
+    class Meta(BitAxeDeviceSerializer.Meta):
+        fields = BitAxeDeviceSerializer.Meta.fields + ('error_message',)
 
 
 class BitAxeDeviceWriteSerializer(serializers.ModelSerializer):
@@ -19,7 +37,10 @@ class BitAxeDeviceWriteSerializer(serializers.ModelSerializer):
 class AvalonDeviceSerializer(serializers.ModelSerializer):
     class Meta:
         model = AvalonDevice
-        fields = '__all__'
+        fields = (
+            'id', 'device_id', 'device_name', 'ip_address',
+            'is_active', 'last_seen_at', 'error_message', 'created_at'
+        )
 
 
 class AvalonDeviceWriteSerializer(serializers.ModelSerializer):
@@ -34,7 +55,12 @@ class BitAxeMiningStatsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = BitAxeMiningStats
-        fields = '__all__'
+        fields = (
+            'id', 'device', 'device_name', 'recorded_at', 'hashrate_ghs',
+            'shares_accepted', 'shares_rejected', 'blocks_found',
+            'uptime_seconds', 'best_difficulty', 'best_session_difficulty',
+            'pool_url', 'pool_user', 'created_at'
+        )
 
 
 class BitAxeHardwareLogSerializer(serializers.ModelSerializer):
@@ -42,7 +68,11 @@ class BitAxeHardwareLogSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = BitAxeHardwareLog
-        fields = '__all__'
+        fields = (
+            'id', 'device', 'device_name', 'recorded_at', 'power_watts',
+            'efficiency_j_per_th', 'temperature_c', 'fan_speed_rpm',
+            'voltage', 'frequency_mhz', 'created_at'
+        )
 
 
 class BitAxeSystemInfoSerializer(serializers.ModelSerializer):
@@ -50,7 +80,21 @@ class BitAxeSystemInfoSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = BitAxeSystemInfo
-        fields = '__all__'
+        fields = (
+            'id', 'device', 'device_name', 'recorded_at',
+            'asic_model', 'board_version', 'hostname', 'mac_address',
+            'version', 'axe_os_version', 'idf_version', 'running_partition',
+            'ssid', 'wifi_status', 'wifi_rssi',
+            'core_voltage', 'core_voltage_actual', 'expected_hashrate',
+            'pool_difficulty', 'small_core_count',
+            'vr_temp', 'temp_target', 'overheat_mode',
+            'auto_fan_speed', 'fan_speed_percent', 'min_fan_speed',
+            'max_power', 'nominal_voltage', 'overclock_enabled',
+            'display_type', 'display_rotation', 'invert_screen', 'display_timeout',
+            'stratum_url', 'stratum_port', 'stratum_user',
+            'fallback_stratum_url', 'fallback_stratum_port', 'is_using_fallback',
+            'free_heap', 'is_psram_available', 'extra', 'created_at'
+        )
 
 
 class BitAxePoolStatsSerializer(serializers.ModelSerializer):
@@ -59,21 +103,22 @@ class BitAxePoolStatsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = BitAxePoolStats
-        fields = '__all__'
+        fields = (
+            'id', 'pool_address', 'recorded_at',
+            'hashrate_1m', 'hashrate_5m', 'hashrate_1hr', 'hashrate_1d', 'hashrate_7d',
+            'lastshare', 'lastshare_datetime', 'workers', 'shares',
+            'bestshare', 'bestever', 'authorised', 'authorised_datetime',
+            'hashrate_1m_ghs', 'hashrate_5m_ghs', 'hashrate_1hr_ghs',
+            'hashrate_1d_ghs', 'hashrate_7d_ghs'
+        )
 
     def get_lastshare_datetime(self, obj):
         """Convert Unix timestamp to ISO datetime string."""
-        from datetime import datetime
-        if obj.lastshare:
-            return datetime.fromtimestamp(obj.lastshare).isoformat()
-        return None
+        return _epoch_to_iso(obj.lastshare)
 
     def get_authorised_datetime(self, obj):
         """Convert Unix timestamp to ISO datetime string."""
-        from datetime import datetime
-        if obj.authorised:
-            return datetime.fromtimestamp(obj.authorised).isoformat()
-        return None
+        return _epoch_to_iso(obj.authorised)
 
 
 class CollectorSettingsSerializer(serializers.ModelSerializer):
@@ -0,0 +1,29 @@
+"""
+Shared test fixtures and isolation helpers.
+"""
+import pytest
+from api.models import CollectorSettings
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def _reset_collector_settings_cache():
+    """Drop the in-process CollectorSettings cache around each test.
+
+    The cache outlives the per-test database, so without this a cached
+    instance from one test would leak into the next one's empty database.
+    """
+    CollectorSettings._cached_settings = None
+    yield
+    CollectorSettings._cached_settings = None
+
+
+@pytest.fixture(autouse=True)
+def _clear_django_cache():
+    """Clear the Django cache around each test.
+
+    View-level response caches (overview analytics, Avalon dashboard) would
+    otherwise serve one test's payload to the next."""
+    cache.clear()
+    yield
+    cache.clear()
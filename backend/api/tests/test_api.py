@@ -3,6 +3,7 @@ Backend API test suite.
 Covers: auth views, device CRUD, stats endpoints, analytics, collector settings.
 Runs against SQLite in-memory via minersentinel.settings_test (MIGRATION_MODULES disabled).
 """
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -140,6 +141,20 @@ class TestAuthViews:
         assert resp.status_code == 200
         assert 'csrfToken' in resp.data
 
+    def test_bootstrap_anonymous(self, api_client):
+        resp = api_client.get('/api/auth/bootstrap/')
+        assert resp.status_code == 200
+        assert 'csrfToken' in resp.data
+        assert resp.data['authenticated'] is False
+        assert resp.data['user'] is None
+
+    def test_bootstrap_authenticated(self, auth_client):
+        resp = auth_client.get('/api/auth/bootstrap/')
+        assert resp.status_code == 200
+        assert 'csrfToken' in resp.data
+        assert resp.data['authenticated'] is True
+        assert resp.data['user']['username'] == 'testuser'
+
     def test_current_user_anonymous(self, api_client):
         resp = api_client.get('/api/auth/user/')
         assert resp.status_code == 200
@@ -261,12 +276,57 @@ class TestBitAxeMiningStatsViewSet:
         resp = auth_client.get(f'/api/bitaxe/mining/hashrate_trend/?device_id={bitaxe_device.device_id}')
         assert resp.status_code == 200
 
+    def test_hashrate_trend_bucketed(self, auth_client, mining_stat):
+        resp = auth_client.get('/api/bitaxe/mining/hashrate_trend/?bucket=hour')
+        assert resp.status_code == 200
+        assert len(resp.data) == 1
+        assert resp.data[0]['avg_hashrate_ghs'] == pytest.approx(450.5)
+        assert 'bucket' in resp.data[0]
+
     def test_latest_device_no_stats(self, auth_client, bitaxe_device):
         # Device exists but has no mining stats → False branch of `if latest_stat:`
         resp = auth_client.get('/api/bitaxe/mining/latest/')
         assert resp.status_code == 200
         assert resp.data == []
 
+    def test_latest_query_count_constant(self, auth_client, bitaxe_device, django_assert_max_num_queries):
+        # latest uses a single correlated subquery, not a query per device
+        now = timezone.now()
+        other = BitAxeDevice.objects.create(
+            device_id='bitaxe-other', device_name='Other Bitaxe', ip_address='192.168.1.101'
+        )
+        for device in (bitaxe_device, other):
+            BitAxeMiningStats.objects.bulk_create([
+                BitAxeMiningStats(
+                    device=device, recorded_at=now - timedelta(minutes=i),
+                    hashrate_ghs=400.0 + i, shares_accepted=10, shares_rejected=0,
+                    uptime_seconds=3600,
+                )
+                for i in range(5)
+            ])
+        with django_assert_max_num_queries(3):
+            resp = auth_client.get('/api/bitaxe/mining/latest/')
+        assert resp.status_code == 200
+        assert len(resp.data) == 2
+        assert all(row['hashrate_ghs'] == pytest.approx(400.0) for row in resp.data)
+
+    def test_list_query_count_constant(self, auth_client, bitaxe_device, django_assert_max_num_queries):
+        # device is select_related on the list queryset: serializing N rows
+        # must not add a query per row for device.device_name
+        now = timezone.now()
+        BitAxeMiningStats.objects.bulk_create([
+            BitAxeMiningStats(
+                device=bitaxe_device, recorded_at=now - timedelta(minutes=i),
+                hashrate_ghs=450.0 + i, shares_accepted=100, shares_rejected=1,
+                uptime_seconds=3600,
+            )
+            for i in range(10)
+        ])
+        with django_assert_max_num_queries(3):
+            resp = auth_client.get('/api/bitaxe/mining/')
+        assert resp.status_code == 200
+        assert len(resp.data['results']) == 10
+
 
 # ---------------------------------------------------------------------------
 # BitAxe hardware log tests
@@ -535,6 +595,14 @@ class TestCollectorSettings:
         CollectorSettings.get_settings()
         assert CollectorSettings.objects.count() == 1
 
+    def test_settings_version_bumped_on_update(self, db):
+        settings = CollectorSettings.get_settings()
+        initial = settings.version
+        settings.polling_interval_minutes = 42
+        settings.save()
+        assert settings.version == initial + 1
+        assert CollectorSettings.get_settings().polling_interval_minutes == 42
+
     def test_update_settings_invalid(self, auth_client):
         resp = auth_client.post(
             '/api/settings/collector/',
@@ -586,6 +654,21 @@ class TestModels:
         assert stat.hashrate_1m_ghs == pytest.approx(2.0)
         assert stat.hashrate_1d_ghs == pytest.approx(0.9)
 
+    def test_pool_stat_bulk_record_converts_hashrate(self, db):
+        base = dict(
+            hashrate_5m='1.5G', hashrate_1hr='1G', hashrate_7d='800M',
+            lastshare=1700000000, workers=1, shares=100000,
+            bestshare=1234567.0, bestever=9876543, authorised=1699000000,
+        )
+        BitAxePoolStats.bulk_record([
+            dict(base, pool_address='bc1qbulk1', hashrate_1m='2G', hashrate_1d='900M'),
+            dict(base, pool_address='bc1qbulk2', hashrate_1m='1T', hashrate_1d='500M'),
+        ])
+        stats = {s.pool_address: s for s in BitAxePoolStats.objects.filter(pool_address__startswith='bc1qbulk')}
+        assert stats['bc1qbulk1'].hashrate_1m_ghs == pytest.approx(2.0)
+        assert stats['bc1qbulk1'].hashrate_1d_ghs == pytest.approx(0.9)
+        assert stats['bc1qbulk2'].hashrate_1m_ghs == pytest.approx(1000.0)
+
     def test_avalon_device_str(self, avalon_device):
         assert 'Test Avalon' in str(avalon_device)
 
@@ -1029,6 +1112,33 @@ class TestHelperFunctions:
         from api.views import _format_time_duration
         assert 'years' in _format_time_duration(9000)
 
+    def test_best_share_outlook_zero_inputs(self):
+        from api.views import _best_share_outlook
+        assert _best_share_outlook(0, 1000) == (0, 0, 0, 0, 0)
+        assert _best_share_outlook(500, 0) == (0, 0, 0, 0, 0)
+
+    def test_best_share_outlook_probabilities_increase_with_horizon(self):
+        from api.views import _best_share_outlook
+        hours, days, p1h, p24h, p7d = _best_share_outlook(500, 1_000_000)
+        assert hours > 0
+        assert days == pytest.approx(hours / 24)
+        assert 0 < p1h < p24h < p7d <= 1
+
+    def test_invalidate_analytics_cache_changes_key(self):
+        # Bumping the generation must rotate every analytics cache key so
+        # stale payloads are never served after a manual poll.
+        from api.views import _analytics_cache_key, _invalidate_analytics_cache
+        before = _analytics_cache_key('overview_analytics_v1', 24, 7)
+        _invalidate_analytics_cache()
+        after = _analytics_cache_key('overview_analytics_v1', 24, 7)
+        assert before != after
+
+    def test_caggs_unavailable_on_sqlite(self, db):
+        # The test database is SQLite, so the overview must take the
+        # raw-table fallback rather than the continuous-aggregate path.
+        from api.views import _timescale_caggs_available
+        assert _timescale_caggs_available() is False
+
 
 # ---------------------------------------------------------------------------
 # Extended overview analytics tests (covers best-share + financial paths)
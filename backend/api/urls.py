@@ -1,9 +1,12 @@
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from . import avalon_views, views
 
-router = DefaultRouter()
+# SimpleRouter: same externally-visible routes as DefaultRouter but without
+# the API root view and per-viewset .json/.xml format-suffix patterns, so the
+# resolver walks about half as many patterns per request.
+router = SimpleRouter(trailing_slash=True)
 
 # Bitaxe endpoints
 router.register(r'bitaxe/devices', views.BitAxeDeviceViewSet, basename='bitaxe-devices')
@@ -32,6 +35,7 @@ urlpatterns = [
     path('settings/network-data/', views.get_network_data, name='network-data'),
     path('settings/network-data/refresh/', views.refresh_network_data, name='refresh-network-data'),
     # Authentication endpoints
+    path('auth/bootstrap/', views.auth_bootstrap_view, name='auth-bootstrap'),
     path('auth/csrf/', views.csrf_token_view, name='csrf-token'),
     path('auth/login/', views.login_view, name='login'),
     path('auth/logout/', views.logout_view, name='logout'),
@@ -1,13 +1,38 @@
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 from django.contrib.auth import authenticate, login, logout
-from django.db.models import Avg, Count, Max, Min, Q, Sum
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import (
+    Avg,
+    CharField,
+    Count,
+    F,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Coalesce, Round, TruncHour, TruncMinute
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status, viewsets
-from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.decorators import (
+    action,
+    api_view,
+    permission_classes,
+    renderer_classes,
+)
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
@@ -18,14 +43,18 @@ from .models import (
     AvalonSystemInfo,
     BitAxeDevice,
     BitAxeHardwareLog,
+    BitAxeHardwareLog1h,
     BitAxeMiningStats,
+    BitAxeMiningStats1h,
     BitAxePoolStats,
     BitAxeSystemInfo,
     CollectorSettings,
 )
+from .renderers import ORJSONRenderer
 from .serializers import (
     AvalonDeviceSerializer,
     AvalonDeviceWriteSerializer,
+    BitAxeDeviceDetailSerializer,
     BitAxeDeviceSerializer,
     BitAxeDeviceWriteSerializer,
     BitAxeHardwareLogSerializer,
@@ -38,6 +67,185 @@ from .serializers import (
 logger = logging.getLogger(__name__)
 
 
+def _latest_per_device(model):
+    """Newest row per device in a single query.
+
+    Replaces the per-device ``filter(device=...).first()`` loops (one query
+    per device) with a correlated subquery the database resolves in one
+    round trip, using the (device, recorded_at DESC) index.
+    """
+    newest_pk = model.objects.filter(
+        device=OuterRef('device')
+    ).order_by('-recorded_at').values('pk')[:1]
+    return model.objects.filter(pk=Subquery(newest_pk))
+
+
+@lru_cache(maxsize=256)
+def _best_share_outlook(hashrate_ghs, best_difficulty):
+    """Expected time and probabilities for beating the current best share.
+
+    Share difficulty is NOT the number of hashes needed: difficulty D means
+    on average 2^32 * D hashes to find a qualifying share, so the expected
+    time is (D * 2^32) / hashrate and the beat-within-t probability follows
+    the exponential distribution P(T <= t) = 1 - exp(-t * hashrate / (D * 2^32)).
+
+    A pure function of two slow-moving inputs (the hashrate is quantized to
+    whole GH/s by the caller), so repeat requests between collector writes
+    hit the lru_cache instead of re-running the exponential math.
+
+    Returns ``(expected_hours, expected_days, prob_1h, prob_24h, prob_7d)``.
+    """
+    if hashrate_ghs <= 0 or best_difficulty <= 0:
+        return 0, 0, 0, 0, 0
+
+    TWO_POW_32 = 4294967296  # 2^32
+    total_hashrate_hs = hashrate_ghs * 1e9
+
+    # Expected time to find a share equal to or better than current best
+    expected_seconds = (best_difficulty * TWO_POW_32) / total_hashrate_hs
+    expected_hours = expected_seconds / 3600
+    expected_days = expected_hours / 24
+
+    # Rate parameter lambda = hashrate / (difficulty * 2^32); probabilities
+    # clamped to [0, 1] to avoid floating point issues showing > 100%. The
+    # horizons are evaluated as one vectorized np.exp, so adding more time
+    # buckets costs nothing extra.
+    lambda_rate = total_hashrate_hs / (best_difficulty * TWO_POW_32)
+    horizons = np.array([3600, 86400, 604800], dtype=np.float64)
+    probs = np.clip(1 - np.exp(-horizons * lambda_rate), 0.0, 1.0)
+    prob_beat_1h, prob_beat_24h, prob_beat_7d = (float(p) for p in probs)
+
+    return expected_hours, expected_days, prob_beat_1h, prob_beat_24h, prob_beat_7d
+
+
+def _rate_pct(part, total, ndigits=2):
+    """Share-rate percentage with the zero-denominator guard hoisted.
+
+    The overview builds the same ``part / total * 100`` expression for
+    rejection, acceptance and stale rates; callers precompute the shared
+    total once and pass it in.
+    """
+    return round(part / total * 100, ndigits) if total > 0 else 0
+
+
+@dataclass(slots=True)
+class _HourlyBestShares:
+    """Per-hour merge record for the best-share trend.
+
+    One of these exists per bucket while the Bitaxe and Avalon hourly
+    maxima are folded together; slots keep it to a fixed six-attribute
+    layout instead of a dict per hour.
+    """
+    hour: str
+    hashrate_ghs: float = 0.0
+    bitaxe_best_share: float = 0
+    bitaxe_device_name: str | None = None
+    avalon_best_share: float = 0
+    avalon_device_name: str | None = None
+
+
+_ANALYTICS_CACHE_GEN_KEY = 'analytics_cache_gen'
+
+
+def _analytics_cache_key(prefix, hours, days):
+    """Cache key for an assembled analytics payload.
+
+    A generation counter is folded into the key so every parameter
+    combination can be invalidated at once by bumping the counter, which
+    the per-key cache backend cannot do with a pattern delete.
+    """
+    gen = cache.get(_ANALYTICS_CACHE_GEN_KEY, 0)
+    return f'{prefix}:{gen}:{hours}:{days}'
+
+
+def _invalidate_analytics_cache():
+    """Expire all cached analytics payloads by bumping the generation."""
+    try:
+        cache.incr(_ANALYTICS_CACHE_GEN_KEY)
+    except ValueError:
+        cache.add(_ANALYTICS_CACHE_GEN_KEY, 1)
+
+
+def _analytics_cache_timeout():
+    """Response-cache TTL tied to the collector polling interval.
+
+    The analytics only change when the collector writes, so the payload
+    can live for most of a polling cycle. Clamped to [30s, 5min]: the
+    scheduled collector runs in a separate process and cannot bump the
+    in-process generation counter, so the TTL is the staleness bound.
+    """
+    minutes = CollectorSettings.get_settings().polling_interval_minutes or 1
+    return max(30, min(minutes * 60, 300))
+
+
+_caggs_available = None
+
+
+def _timescale_caggs_available():
+    """True when the continuous aggregates from migration 0013 exist.
+
+    They are created at migrate time (and only when the timescaledb
+    extension is installed), so the probe result holds for the process
+    lifetime and is cached after the first call. On SQLite and plain
+    Postgres this is always False and callers use the raw tables.
+    """
+    global _caggs_available
+    if _caggs_available is None:
+        if connection.vendor != 'postgresql':
+            _caggs_available = False
+        else:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT to_regclass('bitaxe_mining_stats_1h') IS NOT NULL")
+                _caggs_available = cursor.fetchone()[0]
+    return _caggs_available
+
+
+def _bucket_trunc(request):
+    """Truncation function for an explicit ?bucket=minute|hour downsample
+    request on the trend endpoints, or None for raw rows.
+
+    Bucketing aggregates in SQL before anything crosses the wire, so an
+    N-hour trend costs O(buckets) rows instead of one row per sample.
+    """
+    bucket = request.query_params.get('bucket')
+    if bucket == 'minute':
+        return TruncMinute
+    if bucket == 'hour':
+        return TruncHour
+    return None
+
+
+# Column tuples for device_details: the latest rows are emitted straight from
+# values() dicts, mirroring the corresponding serializer field lists (minus
+# device_name, which the view fills in from the already-loaded device).
+_MINING_DETAIL_FIELDS = (
+    'id', 'device', 'recorded_at', 'hashrate_ghs',
+    'shares_accepted', 'shares_rejected', 'blocks_found',
+    'uptime_seconds', 'best_difficulty', 'best_session_difficulty',
+    'pool_url', 'pool_user', 'created_at'
+)
+_HARDWARE_DETAIL_FIELDS = (
+    'id', 'device', 'recorded_at', 'power_watts',
+    'efficiency_j_per_th', 'temperature_c', 'fan_speed_rpm',
+    'voltage', 'frequency_mhz', 'created_at'
+)
+_SYSTEM_DETAIL_FIELDS = (
+    'id', 'device', 'recorded_at',
+    'asic_model', 'board_version', 'hostname', 'mac_address',
+    'version', 'axe_os_version', 'idf_version', 'running_partition',
+    'ssid', 'wifi_status', 'wifi_rssi',
+    'core_voltage', 'core_voltage_actual', 'expected_hashrate',
+    'pool_difficulty', 'small_core_count',
+    'vr_temp', 'temp_target', 'overheat_mode',
+    'auto_fan_speed', 'fan_speed_percent', 'min_fan_speed',
+    'max_power', 'nominal_voltage', 'overclock_enabled',
+    'display_type', 'display_rotation', 'invert_screen', 'display_timeout',
+    'stratum_url', 'stratum_port', 'stratum_user',
+    'fallback_stratum_url', 'fallback_stratum_port', 'is_using_fallback',
+    'free_heap', 'is_psram_available', 'extra', 'created_at'
+)
+
+
 class BitAxeDeviceViewSet(viewsets.ModelViewSet):
     """
     API endpoint for Bitaxe devices with full CRUD operations.
@@ -49,6 +257,9 @@ class BitAxeDeviceViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Optionally filter to only active devices."""
         queryset = super().get_queryset()
+        if self.action == 'list':
+            # The unbounded error_message text is detail-only
+            queryset = queryset.light()
         active_only = self.request.query_params.get('active_only', 'false').lower() == 'true'
         if active_only:
             queryset = queryset.filter(is_active=True)
@@ -58,6 +269,8 @@ class BitAxeDeviceViewSet(viewsets.ModelViewSet):
         """Use write serializer for create/update operations."""
         if self.action in ['create', 'update', 'partial_update']:
             return BitAxeDeviceWriteSerializer
+        if self.action == 'retrieve':
+            return BitAxeDeviceDetailSerializer
         return BitAxeDeviceSerializer
 
 
@@ -65,7 +278,9 @@ class BitAxeMiningStatsViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for Bitaxe mining statistics.
     """
-    queryset = BitAxeMiningStats.objects.all()
+    # device is joined up front: the serializer reads device.device_name
+    # per row, which would otherwise cost one query per result.
+    queryset = BitAxeMiningStats.objects.select_related('device')
     serializer_class = BitAxeMiningStatsSerializer
 
     def get_queryset(self):
@@ -79,28 +294,33 @@ class BitAxeMiningStatsViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def latest(self, request):
         """Get latest mining stats for all devices."""
-        devices = BitAxeDevice.objects.filter(is_active=True)
-        results = []
-
-        for device in devices:
-            latest_stat = BitAxeMiningStats.objects.filter(device=device).first()
-            if latest_stat:
-                serializer = self.get_serializer(latest_stat)
-                results.append(serializer.data)
-
-        return Response(results)
+        stats = _latest_per_device(BitAxeMiningStats).filter(
+            device__is_active=True
+        ).select_related('device')
+        serializer = self.get_serializer(stats, many=True)
+        return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def hashrate_trend(self, request):
         """Get hashrate trend over time."""
-        device_id = request.query_params.get('device_id')
         hours = int(request.query_params.get('hours', 24))
-        start_time = timezone.now() - timedelta(hours=hours)
-
-        queryset = BitAxeMiningStats.objects.filter(recorded_at__gte=start_time)
-
-        if device_id:
-            queryset = queryset.filter(device__device_id=device_id)
+        now = timezone.now()
+        start_time = now - timedelta(hours=hours)
+
+        # get_queryset() already applies the device_id filter and joins the
+        # device, so the values() below is flattened into a single query.
+        queryset = self.get_queryset().filter(recorded_at__gte=start_time, recorded_at__lt=now)
+
+        trunc = _bucket_trunc(request)
+        if trunc is not None:
+            stats = queryset.annotate(bucket=trunc('recorded_at')).values(
+                'device__device_name', 'bucket'
+            ).annotate(
+                avg_hashrate_ghs=Round(Avg('hashrate_ghs'), 2),
+                max_shares_accepted=Max('shares_accepted'),
+                max_shares_rejected=Max('shares_rejected'),
+            ).order_by('bucket')
+            return Response(list(stats))
 
         stats = queryset.values(
             'device__device_name', 'recorded_at', 'hashrate_ghs',
@@ -114,7 +334,7 @@ class BitAxeHardwareLogViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for Bitaxe hardware logs.
     """
-    queryset = BitAxeHardwareLog.objects.all()
+    queryset = BitAxeHardwareLog.objects.select_related('device')
     serializer_class = BitAxeHardwareLogSerializer
 
     def get_queryset(self):
@@ -128,28 +348,33 @@ class BitAxeHardwareLogViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['get'])
     def latest(self, request):
         """Get latest hardware stats for all devices."""
-        devices = BitAxeDevice.objects.filter(is_active=True)
-        results = []
-
-        for device in devices:
-            latest_log = BitAxeHardwareLog.objects.filter(device=device).first()
-            if latest_log:
-                serializer = self.get_serializer(latest_log)
-                results.append(serializer.data)
-
-        return Response(results)
+        logs = _latest_per_device(BitAxeHardwareLog).filter(
+            device__is_active=True
+        ).select_related('device')
+        serializer = self.get_serializer(logs, many=True)
+        return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def temperature_trend(self, request):
         """Get temperature and power trend over time."""
-        device_id = request.query_params.get('device_id')
         hours = int(request.query_params.get('hours', 24))
-        start_time = timezone.now() - timedelta(hours=hours)
-
-        queryset = BitAxeHardwareLog.objects.filter(recorded_at__gte=start_time)
-
-        if device_id:
-            queryset = queryset.filter(device__device_id=device_id)
+        now = timezone.now()
+        start_time = now - timedelta(hours=hours)
+
+        # get_queryset() already applies the device_id filter (see
+        # hashrate_trend)
+        queryset = self.get_queryset().filter(recorded_at__gte=start_time, recorded_at__lt=now)
+
+        trunc = _bucket_trunc(request)
+        if trunc is not None:
+            logs = queryset.annotate(bucket=trunc('recorded_at')).values(
+                'device__device_name', 'bucket'
+            ).annotate(
+                avg_temperature_c=Round(Avg('temperature_c'), 1),
+                avg_power_watts=Round(Avg('power_watts'), 1),
+                avg_fan_speed_rpm=Round(Avg('fan_speed_rpm'), 0),
+            ).order_by('bucket')
+            return Response(list(logs))
 
         logs = queryset.values(
             'device__device_name', 'recorded_at', 'temperature_c',
@@ -163,7 +388,7 @@ class BitAxeSystemInfoViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoint for Bitaxe system information.
     """
-    queryset = BitAxeSystemInfo.objects.all()
+    queryset = BitAxeSystemInfo.objects.select_related('device')
     serializer_class = BitAxeSystemInfoSerializer
 
     def get_queryset(self):
@@ -182,28 +407,63 @@ class BitAxeSystemInfoViewSet(viewsets.ReadOnlyModelViewSet):
         except BitAxeDevice.DoesNotExist:
             return Response({'detail': 'Device not found'}, status=status.HTTP_404_NOT_FOUND)
 
-        # Get latest data from all tables
-        latest_mining = BitAxeMiningStats.objects.filter(device=device).first()
-        latest_hardware = BitAxeHardwareLog.objects.filter(device=device).first()
-        latest_system = BitAxeSystemInfo.objects.filter(device=device).first()
-
-        # Get trends (last 24 hours)
-        start_time = timezone.now() - timedelta(hours=24)
-        hashrate_trend = BitAxeMiningStats.objects.filter(
-            device=device,
-            recorded_at__gte=start_time
-        ).values('recorded_at', 'hashrate_ghs', 'shares_accepted', 'shares_rejected').order_by('recorded_at')
-
-        temp_trend = BitAxeHardwareLog.objects.filter(
-            device=device,
-            recorded_at__gte=start_time
-        ).values('recorded_at', 'temperature_c', 'power_watts', 'fan_speed_rpm').order_by('recorded_at')
+        # Latest data from all tables as plain values() dicts: the payload
+        # is emitted directly, with no serializer instantiation or model
+        # materialization per row. device_name comes from the device already
+        # in hand rather than a join.
+        # The explicit ordering (rather than relying on Meta.ordering)
+        # matches the (device, recorded_at DESC) composite indexes from
+        # migrations 0011/0015, so each lookup is a single index seek.
+        latest_mining = BitAxeMiningStats.objects.filter(device=device).order_by('-recorded_at').values(*_MINING_DETAIL_FIELDS).first()
+        latest_hardware = BitAxeHardwareLog.objects.filter(device=device).order_by('-recorded_at').values(*_HARDWARE_DETAIL_FIELDS).first()
+        latest_system = BitAxeSystemInfo.objects.filter(device=device).order_by('-recorded_at').values(*_SYSTEM_DETAIL_FIELDS).first()
+        for row in (latest_mining, latest_hardware, latest_system):
+            if row:
+                row['device_name'] = device.device_name
+
+        # Get trends (last 24 hours), downsampled in SQL when ?bucket=minute|hour
+        now = timezone.now()
+        start_time = now - timedelta(hours=24)
+        trunc = _bucket_trunc(request)
+
+        if trunc is not None:
+            hashrate_trend = BitAxeMiningStats.objects.filter(
+                device=device,
+                recorded_at__gte=start_time,
+                recorded_at__lt=now
+            ).annotate(bucket=trunc('recorded_at')).values('bucket').annotate(
+                avg_hashrate_ghs=Round(Avg('hashrate_ghs'), 2),
+                max_shares_accepted=Max('shares_accepted'),
+                max_shares_rejected=Max('shares_rejected'),
+            ).order_by('bucket')
+
+            temp_trend = BitAxeHardwareLog.objects.filter(
+                device=device,
+                recorded_at__gte=start_time,
+                recorded_at__lt=now
+            ).annotate(bucket=trunc('recorded_at')).values('bucket').annotate(
+                avg_temperature_c=Round(Avg('temperature_c'), 1),
+                avg_power_watts=Round(Avg('power_watts'), 1),
+                avg_fan_speed_rpm=Round(Avg('fan_speed_rpm'), 0),
+            ).order_by('bucket')
+        else:
+            hashrate_trend = BitAxeMiningStats.objects.filter(
+                device=device,
+                recorded_at__gte=start_time,
+                recorded_at__lt=now
+            ).values('recorded_at', 'hashrate_ghs', 'shares_accepted', 'shares_rejected').order_by('recorded_at')
+
+            temp_trend = BitAxeHardwareLog.objects.filter(
+                device=device,
+                recorded_at__gte=start_time,
+                recorded_at__lt=now
+            ).values('recorded_at', 'temperature_c', 'power_watts', 'fan_speed_rpm').order_by('recorded_at')
 
         return Response({
             'device': BitAxeDeviceSerializer(device).data,
-            'latest_mining': BitAxeMiningStatsSerializer(latest_mining).data if latest_mining else None,
-            'latest_hardware': BitAxeHardwareLogSerializer(latest_hardware).data if latest_hardware else None,
-            'latest_system': BitAxeSystemInfoSerializer(latest_system).data if latest_system else None,
+            'latest_mining': latest_mining,
+            'latest_hardware': latest_hardware,
+            'latest_system': latest_system,
             'hashrate_trend_24h': list(hashrate_trend),
             'temperature_trend_24h': list(temp_trend),
         })
@@ -229,10 +489,13 @@ class BitAxePoolStatsViewSet(viewsets.ReadOnlyModelViewSet):
         """Get the most recent pool statistics."""
         pool_address = request.query_params.get('pool_address')
 
+        # Explicit ordering keeps these on the (pool_address, recorded_at
+        # DESC) / recorded_at DESC indexes from migration 0011 instead of
+        # whatever Meta.ordering implies.
         if pool_address:
-            latest_stat = BitAxePoolStats.objects.filter(pool_address=pool_address).first()
+            latest_stat = BitAxePoolStats.objects.filter(pool_address=pool_address).order_by('-recorded_at').first()
         else:
-            latest_stat = BitAxePoolStats.objects.first()
+            latest_stat = BitAxePoolStats.objects.order_by('-recorded_at').first()
 
         if latest_stat:
             serializer = self.get_serializer(latest_stat)
@@ -244,12 +507,24 @@ class BitAxePoolStatsViewSet(viewsets.ReadOnlyModelViewSet):
         """Get hashrate trend over time."""
         pool_address = request.query_params.get('pool_address')
         hours = int(request.query_params.get('hours', 24))
-        start_time = timezone.now() - timedelta(hours=hours)
+        now = timezone.now()
+        start_time = now - timedelta(hours=hours)
 
-        queryset = BitAxePoolStats.objects.filter(recorded_at__gte=start_time)
+        queryset = BitAxePoolStats.objects.filter(recorded_at__gte=start_time, recorded_at__lt=now)
         if pool_address:
             queryset = queryset.filter(pool_address=pool_address)
 
+        trunc = _bucket_trunc(request)
+        if trunc is not None:
+            stats = queryset.annotate(bucket=trunc('recorded_at')).values(
+                'bucket'
+            ).annotate(
+                avg_hashrate_ghs=Round(Avg('hashrate_1m_ghs'), 2),
+                max_shares=Max('shares'),
+                avg_workers=Round(Avg('workers'), 1),
+            ).order_by('bucket')
+            return Response(list(stats))
+
         stats = queryset.values(
             'recorded_at', 'hashrate_1m', 'hashrate_5m', 'hashrate_1hr',
             'hashrate_1d', 'hashrate_1m_ghs', 'shares', 'workers'
@@ -268,37 +543,35 @@ class BitAxePoolStatsViewSet(viewsets.ReadOnlyModelViewSet):
         if pool_address:
             queryset = queryset.filter(pool_address=pool_address)
 
-        if not queryset.exists():
-            return Response({
-                'total_shares': 0,
-                'avg_workers': 0,
-                'max_hashrate_ghs': 0,
-                'best_share': 0,
-                'data_points': 0,
-            })
-
+        # One aggregate covers everything: the shares counter is cumulative,
+        # so Min/Max give the period's first/latest values without the old
+        # exists() probe and two order_by().first() round trips.
         stats = queryset.aggregate(
             latest_shares=Max('shares'),
-            avg_workers=Avg('workers'),
+            first_shares=Min('shares'),
+            avg_workers=Round(Avg('workers'), 1),
             max_hashrate_ghs=Max('hashrate_1m_ghs'),
             best_share=Max('bestshare'),
             data_points=Count('id')
         )
 
-        # Get first record to calculate total shares
-        first_record = queryset.order_by('recorded_at').first()
-        latest_record = queryset.order_by('-recorded_at').first()
-
-        if first_record and latest_record:
-            stats['total_shares'] = latest_record.shares - first_record.shares
-        else:
-            stats['total_shares'] = 0
+        first_shares = stats.pop('first_shares')
+        if not stats['data_points']:
+            return Response({
+                'total_shares': 0,
+                'avg_workers': 0,
+                'max_hashrate_ghs': 0,
+                'best_share': 0,
+                'data_points': 0,
+            })
 
+        stats['total_shares'] = (stats['latest_shares'] or 0) - (first_shares or 0)
         return Response(stats)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer])
 def overview_analytics(request):
     """
     Advanced analytics endpoint for Overview Dashboard.
@@ -307,39 +580,53 @@ def overview_analytics(request):
     hours = int(request.query_params.get('hours', 24))
     days = int(request.query_params.get('days', 7))
 
-    start_time_hours = timezone.now() - timedelta(hours=hours)
-    start_time_days = timezone.now() - timedelta(days=days)
-
-    # Get all active devices (both types)
-    bitaxe_devices = BitAxeDevice.objects.filter(is_active=True)
-    avalon_devices = AvalonDevice.objects.filter(is_active=True)
-    total_device_count = bitaxe_devices.count() + avalon_devices.count()
+    # Dashboards poll this endpoint every few seconds but the underlying
+    # data only changes when the collector writes, so serve the assembled
+    # payload from cache for a short TTL. ?nocache=1 bypasses for debugging.
+    cache_key = _analytics_cache_key('overview_analytics_v1', hours, days)
+    if request.query_params.get('nocache') != '1':
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            return Response(cached_result)
+
+    # One clock read for the whole request: every range below shares the
+    # same [start, now) bound, which also gives the planner a closed range
+    # for chunk exclusion on partitioned tables.
+    now = timezone.now()
+    start_time_hours = now - timedelta(hours=hours)
+    start_time_days = now - timedelta(days=days)
+
+    # Active device counts (both types), evaluated once and reused below —
+    # each count() is its own SELECT count(*)
+    bitaxe_device_count = BitAxeDevice.objects.filter(is_active=True).count()
+    avalon_device_count = AvalonDevice.objects.filter(is_active=True).count()
+    total_device_count = bitaxe_device_count + avalon_device_count
 
     # Mining Statistics Aggregations (both device types)
-    bitaxe_mining_recent = BitAxeMiningStats.objects.filter(recorded_at__gte=start_time_hours)
-    bitaxe_mining_period = BitAxeMiningStats.objects.filter(recorded_at__gte=start_time_days)
-    avalon_mining_recent = AvalonMiningStats.objects.filter(recorded_at__gte=start_time_hours)
-    avalon_mining_period = AvalonMiningStats.objects.filter(recorded_at__gte=start_time_days)
+    bitaxe_mining_recent = BitAxeMiningStats.objects.filter(recorded_at__gte=start_time_hours, recorded_at__lt=now)
+    bitaxe_mining_period = BitAxeMiningStats.objects.filter(recorded_at__gte=start_time_days, recorded_at__lt=now)
+    avalon_mining_recent = AvalonMiningStats.objects.filter(recorded_at__gte=start_time_hours, recorded_at__lt=now)
+    avalon_mining_period = AvalonMiningStats.objects.filter(recorded_at__gte=start_time_days, recorded_at__lt=now)
 
     # Hardware Statistics Aggregations (both device types)
-    bitaxe_hardware_recent = BitAxeHardwareLog.objects.filter(recorded_at__gte=start_time_hours)
-    bitaxe_hardware_period = BitAxeHardwareLog.objects.filter(recorded_at__gte=start_time_days)
-    avalon_hardware_recent = AvalonHardwareLogs.objects.filter(recorded_at__gte=start_time_hours)
-    avalon_hardware_period = AvalonHardwareLogs.objects.filter(recorded_at__gte=start_time_days)
+    bitaxe_hardware_recent = BitAxeHardwareLog.objects.filter(recorded_at__gte=start_time_hours, recorded_at__lt=now)
+    bitaxe_hardware_period = BitAxeHardwareLog.objects.filter(recorded_at__gte=start_time_days, recorded_at__lt=now)
+    avalon_hardware_recent = AvalonHardwareLogs.objects.filter(recorded_at__gte=start_time_hours, recorded_at__lt=now)
+    avalon_hardware_period = AvalonHardwareLogs.objects.filter(recorded_at__gte=start_time_days, recorded_at__lt=now)
 
     # Pool Statistics (Bitaxe only for now)
-    pool_stats_recent = BitAxePoolStats.objects.filter(recorded_at__gte=start_time_hours).first()
-    pool_stats_period = BitAxePoolStats.objects.filter(recorded_at__gte=start_time_days)
+    pool_stats_recent = BitAxePoolStats.objects.filter(recorded_at__gte=start_time_hours, recorded_at__lt=now).order_by('-recorded_at').first()
+    pool_stats_period = BitAxePoolStats.objects.filter(recorded_at__gte=start_time_days, recorded_at__lt=now)
 
     # Calculate comprehensive KPIs
     result = {
         'overview': {
             'active_devices': total_device_count,
-            'bitaxe_devices': bitaxe_devices.count(),
-            'avalon_devices': avalon_devices.count(),
+            'bitaxe_devices': bitaxe_device_count,
+            'avalon_devices': avalon_device_count,
             'data_collection_period_hours': hours,
             'analysis_period_days': days,
-            'last_updated': timezone.now().isoformat(),
+            'last_updated': now.isoformat(),
         },
         'mining': {
             'current': {},
@@ -359,27 +646,25 @@ def overview_analytics(request):
         'trends': {},
     }
 
-    # Current Mining Stats (latest for each device, both types)
+    # Current Mining Stats (latest for each device, both types), summed in
+    # SQL over the latest-row-per-device queryset: one aggregate statement
+    # per model, no per-device queries or Python accumulators. Both device
+    # types report in GH/s, no conversion needed.
     current_hashrate_total_ghs = 0
     current_shares_accepted = 0
     current_shares_rejected = 0
 
-    # Bitaxe devices (report in GH/s)
-    for device in bitaxe_devices:
-        latest_mining = BitAxeMiningStats.objects.filter(device=device).first()
-        if latest_mining:
-            current_hashrate_total_ghs += latest_mining.hashrate_ghs or 0
-            current_shares_accepted += latest_mining.shares_accepted or 0
-            current_shares_rejected += latest_mining.shares_rejected or 0
-
-    # Avalon devices (already report in GH/s)
-    for device in avalon_devices:
-        latest_mining = AvalonMiningStats.objects.filter(device=device).first()
-        if latest_mining:
-            # Avalon already reports in GH/s, no conversion needed
-            current_hashrate_total_ghs += latest_mining.hashrate_ghs or 0
-            current_shares_accepted += latest_mining.shares_accepted or 0
-            current_shares_rejected += latest_mining.shares_rejected or 0
+    for model in (BitAxeMiningStats, AvalonMiningStats):
+        current_agg = _latest_per_device(model).filter(
+            device__is_active=True
+        ).aggregate(
+            total_hashrate=Coalesce(Sum('hashrate_ghs'), 0.0),
+            total_accepted=Coalesce(Sum('shares_accepted'), 0),
+            total_rejected=Coalesce(Sum('shares_rejected'), 0),
+        )
+        current_hashrate_total_ghs += current_agg['total_hashrate']
+        current_shares_accepted += current_agg['total_accepted']
+        current_shares_rejected += current_agg['total_rejected']
 
     # Get the latest best share from recent data
     best_share_bitaxe_latest = BitAxeMiningStats.objects.filter(best_difficulty__isnull=False).order_by('-best_difficulty').values('best_difficulty', 'recorded_at').first()
@@ -393,52 +678,67 @@ def overview_analytics(request):
         best_share_ever_latest = { 'best_difficulty': best_share_avalon_latest['difficulty'], 'recorded_at': best_share_avalon_latest['recorded_at'] }
 
 
+    current_shares_total = current_shares_accepted + current_shares_rejected
     result['mining']['current'] = {
         'total_hashrate_ghs': round(current_hashrate_total_ghs, 2),
         'total_hashrate_ths': round(current_hashrate_total_ghs / 1000, 4),
         'total_shares_accepted': current_shares_accepted,
         'total_shares_rejected': current_shares_rejected,
-        'rejection_rate': round((current_shares_rejected / (current_shares_accepted + current_shares_rejected) * 100), 2) if (current_shares_accepted + current_shares_rejected) > 0 else 0,
-        'acceptance_rate': round((current_shares_accepted / (current_shares_accepted + current_shares_rejected) * 100), 2) if (current_shares_accepted + current_shares_rejected) > 0 else 0,
+        'rejection_rate': _rate_pct(current_shares_rejected, current_shares_total),
+        'acceptance_rate': _rate_pct(current_shares_accepted, current_shares_total),
         'best_share_difficulty': best_share_ever_latest['best_difficulty'] if best_share_ever_latest else None,
         'best_share_timestamp': best_share_ever_latest['recorded_at'].isoformat() if best_share_ever_latest else None,
     }
 
     # Period Mining Stats (aggregated over time for both device types)
     # Bitaxe aggregation
+    # Coalesce in SQL covers the empty-period None case, so the merge
+    # lines below add the values straight off (best_diff_period stays
+    # nullable on purpose: None skips the timestamp lookup).
     bitaxe_mining_agg = bitaxe_mining_period.aggregate(
-        avg_hashrate=Avg('hashrate_ghs'),
-        max_hashrate=Max('hashrate_ghs'),
-        min_hashrate=Min('hashrate_ghs'),
-        total_shares_period=Sum('shares_accepted'),
-        total_rejected_period=Sum('shares_rejected'),
+        avg_hashrate=Coalesce(Avg('hashrate_ghs'), 0.0),
+        max_hashrate=Coalesce(Max('hashrate_ghs'), 0.0),
+        min_hashrate=Coalesce(Min('hashrate_ghs'), 0.0),
+        total_shares_period=Coalesce(Sum('shares_accepted'), 0),
+        total_rejected_period=Coalesce(Sum('shares_rejected'), 0),
         data_points=Count('id'),
+        # Folded in here so the period best share does not need its own
+        # sorted query below
+        best_diff_period=Max('best_difficulty'),
     )
 
     # Avalon aggregation (also in GH/s)
     avalon_mining_agg = avalon_mining_period.aggregate(
-        avg_hashrate=Avg('hashrate_ghs'),
-        max_hashrate=Max('hashrate_ghs'),
-        min_hashrate=Min('hashrate_ghs'),
-        total_shares_period=Sum('shares_accepted'),
-        total_rejected_period=Sum('shares_rejected'),
+        avg_hashrate=Coalesce(Avg('hashrate_ghs'), 0.0),
+        max_hashrate=Coalesce(Max('hashrate_ghs'), 0.0),
+        min_hashrate=Coalesce(Min('hashrate_ghs'), 0.0),
+        total_shares_period=Coalesce(Sum('shares_accepted'), 0),
+        total_rejected_period=Coalesce(Sum('shares_rejected'), 0),
         data_points=Count('id'),
     )
 
     # Combine both device types
-    combined_avg_hashrate = (bitaxe_mining_agg['avg_hashrate'] or 0) + (avalon_mining_agg['avg_hashrate'] or 0)
-    combined_max_hashrate = (bitaxe_mining_agg['max_hashrate'] or 0) + (avalon_mining_agg['max_hashrate'] or 0)
-    combined_min_hashrate = (bitaxe_mining_agg['min_hashrate'] or 0) + (avalon_mining_agg['min_hashrate'] or 0)
-    combined_shares_accepted = (bitaxe_mining_agg['total_shares_period'] or 0) + (avalon_mining_agg['total_shares_period'] or 0)
-    combined_shares_rejected = (bitaxe_mining_agg['total_rejected_period'] or 0) + (avalon_mining_agg['total_rejected_period'] or 0)
-    combined_data_points = (bitaxe_mining_agg['data_points'] or 0) + (avalon_mining_agg['data_points'] or 0)
-
-    # Get best share from the period
-    period_best_share = BitAxeMiningStats.objects.filter(
-        recorded_at__gte=start_time_days,
-        best_difficulty__isnull=False
-    ).order_by('-best_difficulty').first()
-
+    combined_avg_hashrate = bitaxe_mining_agg['avg_hashrate'] + avalon_mining_agg['avg_hashrate']
+    combined_max_hashrate = bitaxe_mining_agg['max_hashrate'] + avalon_mining_agg['max_hashrate']
+    combined_min_hashrate = bitaxe_mining_agg['min_hashrate'] + avalon_mining_agg['min_hashrate']
+    combined_shares_accepted = bitaxe_mining_agg['total_shares_period'] + avalon_mining_agg['total_shares_period']
+    combined_shares_rejected = bitaxe_mining_agg['total_rejected_period'] + avalon_mining_agg['total_rejected_period']
+    combined_data_points = bitaxe_mining_agg['data_points'] + avalon_mining_agg['data_points']
+
+    # The period's best share value came out of the aggregate above; only
+    # its timestamp needs a lookup, and the equality filter is an index
+    # seek instead of the old full descending sort. Skipped entirely when
+    # the period has no best shares.
+    period_best_diff = bitaxe_mining_agg['best_diff_period']
+    period_best_timestamp = None
+    if period_best_diff is not None:
+        period_best_timestamp = BitAxeMiningStats.objects.filter(
+            recorded_at__gte=start_time_days,
+            recorded_at__lt=now,
+            best_difficulty=period_best_diff,
+        ).values_list('recorded_at', flat=True).first()
+
+    combined_shares_total = combined_shares_accepted + combined_shares_rejected
     result['mining']['period'] = {
         'avg_hashrate_ghs': round(combined_avg_hashrate, 2),
         'max_hashrate_ghs': round(combined_max_hashrate, 2),
@@ -446,57 +746,51 @@ def overview_analytics(request):
         'hashrate_stability': round((combined_min_hashrate / combined_max_hashrate * 100), 1) if combined_max_hashrate else 0,
         'total_shares_accepted': combined_shares_accepted,
         'total_shares_rejected': combined_shares_rejected,
-        'total_shares': combined_shares_accepted + combined_shares_rejected,
+        'total_shares': combined_shares_total,
         'data_points': combined_data_points,
-        'best_share_difficulty': period_best_share.best_difficulty if period_best_share else None,
-        'best_share_timestamp': period_best_share.recorded_at.isoformat() if period_best_share else None,
+        'best_share_difficulty': period_best_diff,
+        'best_share_timestamp': period_best_timestamp.isoformat() if period_best_timestamp else None,
     }
 
     # Mining Efficiency Metrics
     result['mining']['efficiency'] = {
         'shares_per_hour': round(combined_shares_accepted / hours, 1) if hours > 0 else 0,
         'shares_per_day': round(combined_shares_accepted / days, 1) if days > 0 else 0,
-        'rejection_rate': round((combined_shares_rejected / (combined_shares_accepted + combined_shares_rejected) * 100), 2) if (combined_shares_accepted + combined_shares_rejected) > 0 else 0,
+        'rejection_rate': _rate_pct(combined_shares_rejected, combined_shares_total),
         'best_share_ever': best_share_ever_latest['best_difficulty'] if best_share_ever_latest else 0,
         'best_share_timestamp': best_share_ever_latest['recorded_at'].isoformat() if best_share_ever_latest else None,
         'avg_efficiency': round(combined_avg_hashrate / total_device_count, 2) if total_device_count > 0 else 0,
     }
 
-    # Current Hardware Stats (both device types)
-    current_temp_total = 0
-    current_power_total = 0
-    current_fan_speed_total = 0
-    current_temp_count = 0
-    current_power_count = 0
-    current_fan_speed_count = 0
-
-    # Bitaxe hardware stats
-    for device in bitaxe_devices:
-        latest_hardware = BitAxeHardwareLog.objects.filter(device=device).first()
-        if latest_hardware:
-            if latest_hardware.temperature_c:
-                current_temp_total += latest_hardware.temperature_c
-                current_temp_count += 1
-            if latest_hardware.power_watts:
-                current_power_total += latest_hardware.power_watts
-                current_power_count += 1
-            if latest_hardware.fan_speed_rpm:
-                current_fan_speed_total += latest_hardware.fan_speed_rpm
-                current_fan_speed_count += 1
-
-    # Avalon hardware stats
-    for device in avalon_devices:
-        latest_hardware = AvalonHardwareLogs.objects.filter(device=device).first()
-        if latest_hardware:
-            if latest_hardware.temperature_c:
-                current_temp_total += latest_hardware.temperature_c
-                current_temp_count += 1
-            if latest_hardware.power_watts:
-                current_power_total += latest_hardware.power_watts
-                current_power_count += 1
-            if latest_hardware.fan_speed_rpm:
-                current_fan_speed_total += latest_hardware.fan_speed_rpm
-                current_fan_speed_count += 1
+    # Current Hardware Stats (both device types). One latest-row-per-device
+    # query per model (see mining current above), reduced column-wise in
+    # pandas instead of a per-row Python branch per metric. Zero readings
+    # were treated as missing by the old truthiness checks, so mask them
+    # before the skipna reductions.
+    current_hw_rows = []
+    for model in (BitAxeHardwareLog, AvalonHardwareLogs):
+        current_hw_rows.extend(
+            _latest_per_device(model).filter(
+                device__is_active=True
+            ).values('temperature_c', 'power_watts', 'fan_speed_rpm')
+        )
+
+    if current_hw_rows:
+        current_hw = pd.DataFrame(current_hw_rows, dtype=float)
+        current_hw = current_hw.mask(current_hw == 0)
+        current_temp_total = current_hw['temperature_c'].sum()
+        current_temp_count = int(current_hw['temperature_c'].count())
+        current_power_total = current_hw['power_watts'].sum()
+        current_power_count = int(current_hw['power_watts'].count())
+        current_fan_speed_total = current_hw['fan_speed_rpm'].sum()
+        current_fan_speed_count = int(current_hw['fan_speed_rpm'].count())
+    else:
+        current_temp_total = 0
+        current_power_total = 0
+        current_fan_speed_total = 0
+        current_temp_count = 0
+        current_power_count = 0
+        current_fan_speed_count = 0
 
     result['hardware']['current'] = {
         'avg_temperature_c': round(current_temp_total / current_temp_count, 1) if current_temp_count > 0 else 0,
@@ -505,64 +799,53 @@ def overview_analytics(request):
         'active_devices': current_power_count,
     }
 
-    # Period Hardware Stats (both device types) - using existing queries
-
-    # Bitaxe hardware aggregation
-    bitaxe_hardware_agg = bitaxe_hardware_period.aggregate(
-        avg_temp=Avg('temperature_c'),
-        max_temp=Max('temperature_c'),
-        min_temp=Min('temperature_c'),
-        avg_power=Avg('power_watts'),
-        max_power=Max('power_watts'),
-        avg_fan_speed=Avg('fan_speed_rpm'),
-        max_fan_speed=Max('fan_speed_rpm'),
-        data_points=Count('id'),
-    )
-
-    # Avalon hardware aggregation
-    avalon_hardware_agg = avalon_hardware_period.aggregate(
-        avg_temp=Avg('temperature_c'),
-        max_temp=Max('temperature_c'),
-        min_temp=Min('temperature_c'),
-        avg_power=Avg('power_watts'),
-        max_power=Max('power_watts'),
-        avg_fan_speed=Avg('fan_speed_rpm'),
-        max_fan_speed=Max('fan_speed_rpm'),
-        data_points=Count('id'),
-    )
+    # Period Hardware Stats (both device types). Sums and counts come back
+    # from SQL and the overall averages are a single divide, replacing the
+    # old Avg-per-model recombination with its Python weighted-average and
+    # sentinel-999 min logic. (The ORM cannot aggregate over a UNION of the
+    # two log tables, so this stays one statement per model.)
+    # min_temp is the one aggregate left nullable: a Coalesce-to-zero
+    # would win every min() against real readings.
+    _hw_aggregates = {
+        'sum_temp': Coalesce(Sum('temperature_c'), 0.0),
+        'max_temp': Coalesce(Max('temperature_c'), 0.0),
+        'min_temp': Min('temperature_c'),
+        'sum_power': Coalesce(Sum('power_watts'), 0.0),
+        'max_power': Coalesce(Max('power_watts'), 0.0),
+        'sum_fan_speed': Coalesce(Sum('fan_speed_rpm'), 0),
+        'max_fan_speed': Coalesce(Max('fan_speed_rpm'), 0),
+        'data_points': Count('id'),
+    }
+    bitaxe_hardware_agg = bitaxe_hardware_period.aggregate(**_hw_aggregates)
+    avalon_hardware_agg = avalon_hardware_period.aggregate(**_hw_aggregates)
 
-    # Combine hardware stats (weighted average where applicable)
-    total_hw_data_points = (bitaxe_hardware_agg['data_points'] or 0) + (avalon_hardware_agg['data_points'] or 0)
+    total_hw_data_points = bitaxe_hardware_agg['data_points'] + avalon_hardware_agg['data_points']
 
     if total_hw_data_points > 0:
         combined_avg_temp = (
-            (bitaxe_hardware_agg['avg_temp'] or 0) * (bitaxe_hardware_agg['data_points'] or 0) +
-            (avalon_hardware_agg['avg_temp'] or 0) * (avalon_hardware_agg['data_points'] or 0)
+            bitaxe_hardware_agg['sum_temp'] + avalon_hardware_agg['sum_temp']
         ) / total_hw_data_points
-
         combined_avg_power = (
-            (bitaxe_hardware_agg['avg_power'] or 0) * (bitaxe_hardware_agg['data_points'] or 0) +
-            (avalon_hardware_agg['avg_power'] or 0) * (avalon_hardware_agg['data_points'] or 0)
+            bitaxe_hardware_agg['sum_power'] + avalon_hardware_agg['sum_power']
         ) / total_hw_data_points
-
         combined_avg_fan = (
-            (bitaxe_hardware_agg['avg_fan_speed'] or 0) * (bitaxe_hardware_agg['data_points'] or 0) +
-            (avalon_hardware_agg['avg_fan_speed'] or 0) * (avalon_hardware_agg['data_points'] or 0)
+            bitaxe_hardware_agg['sum_fan_speed'] + avalon_hardware_agg['sum_fan_speed']
         ) / total_hw_data_points
     else:
         combined_avg_temp = 0
         combined_avg_power = 0
         combined_avg_fan = 0
 
-    combined_max_temp = max(bitaxe_hardware_agg['max_temp'] or 0, avalon_hardware_agg['max_temp'] or 0)
-    combined_min_temp = min(bitaxe_hardware_agg['min_temp'] or 999, avalon_hardware_agg['min_temp'] or 999)
-    combined_max_power = max(bitaxe_hardware_agg['max_power'] or 0, avalon_hardware_agg['max_power'] or 0)
-    combined_max_fan = max(bitaxe_hardware_agg['max_fan_speed'] or 0, avalon_hardware_agg['max_fan_speed'] or 0)
+    combined_max_temp = max(bitaxe_hardware_agg['max_temp'], avalon_hardware_agg['max_temp'])
+    min_temps = [agg['min_temp'] for agg in (bitaxe_hardware_agg, avalon_hardware_agg) if agg['min_temp'] is not None]
+    combined_min_temp = min(min_temps) if min_temps else 0
+    combined_max_power = max(bitaxe_hardware_agg['max_power'], avalon_hardware_agg['max_power'])
+    combined_max_fan = max(bitaxe_hardware_agg['max_fan_speed'], avalon_hardware_agg['max_fan_speed'])
 
     result['hardware']['period'] = {
         'avg_temperature_c': round(combined_avg_temp, 1),
         'max_temperature_c': round(combined_max_temp, 1),
-        'min_temperature_c': round(combined_min_temp if combined_min_temp < 999 else 0, 1),
+        'min_temperature_c': round(combined_min_temp, 1),
         'avg_power_watts': round(combined_avg_power, 1),
         'max_power_watts': round(combined_max_power, 1),
         'avg_fan_speed_rpm': round(combined_avg_fan, 0),
@@ -571,7 +854,7 @@ def overview_analytics(request):
     }
 
     # Hardware Health Metrics
-    temp_range = combined_max_temp - (combined_min_temp if combined_min_temp < 999 else 0) if combined_max_temp else 0
+    temp_range = (combined_max_temp - combined_min_temp) if combined_max_temp else 0
     result['hardware']['health'] = {
         'temperature_range_c': round(temp_range, 1),
         'temperature_stability': 100 - min(temp_range * 2, 100),  # Lower range = better stability
@@ -595,24 +878,22 @@ def overview_analytics(request):
             'network_difficulty': 95000000000000,  # Current estimated network difficulty (95T)
         }
 
+    # Rounding happens in the aggregate itself and Coalesce covers the
+    # empty-period None case, so the values below are emitted as-is.
     pool_agg = pool_stats_period.aggregate(
-        avg_hashrate=Avg('hashrate_1m_ghs'),
-        max_hashrate=Max('hashrate_1m_ghs'),
-        avg_workers=Avg('workers'),
-        max_best_share=Max('bestshare'),
+        avg_hashrate=Coalesce(Round(Avg('hashrate_1m_ghs'), 2), 0.0),
+        max_hashrate=Coalesce(Round(Max('hashrate_1m_ghs'), 2), 0.0),
+        avg_workers=Coalesce(Round(Avg('workers'), 1), 0.0),
+        max_best_share=Coalesce(Max('bestshare'), 0.0),
     )
 
-    # Calculate stale share rate as approximation from overall rejection rate
-    stale_rate = 0.0
-    if (combined_shares_accepted + combined_shares_rejected) > 0:
-        stale_rate = (combined_shares_rejected / (combined_shares_accepted + combined_shares_rejected)) * 100
-
     result['pool']['performance'] = {
-        'avg_hashrate_ghs': round(pool_agg['avg_hashrate'] or 0, 2),
-        'max_hashrate_ghs': round(pool_agg['max_hashrate'] or 0, 2),
-        'avg_workers': round(pool_agg['avg_workers'] or 0, 1),
-        'best_share_period': pool_agg['max_best_share'] or 0,
-        'stale_rate': round(stale_rate, 1),
+        'avg_hashrate_ghs': pool_agg['avg_hashrate'],
+        'max_hashrate_ghs': pool_agg['max_hashrate'],
+        'avg_workers': pool_agg['avg_workers'],
+        'best_share_period': pool_agg['max_best_share'],
+        # Stale share rate approximated from the overall rejection rate
+        'stale_rate': _rate_pct(combined_shares_rejected, combined_shares_total, 1),
     }
 
     # Financial Calculations (estimates)
@@ -631,17 +912,21 @@ def overview_analytics(request):
     energy_consumption_kwh_per_day = (current_power_total / 1000) * 24
     energy_cost_per_day = energy_consumption_kwh_per_day * kwh_price
 
+    # Derived once, reused across the payload below
+    usd_per_day = expected_btc_per_day * btc_price_usd
+    net_usd_per_day = usd_per_day - energy_cost_per_day
+
     result['financial'] = {
         'network_percentage': f"{pool_percentage:.10f}",
         'expected_btc_per_day': f"{expected_btc_per_day:.10f}",
-        'expected_usd_per_day': round(expected_btc_per_day * btc_price_usd, 2),
+        'expected_usd_per_day': round(usd_per_day, 2),
         'expected_btc_per_month': f"{expected_btc_per_day * 30:.10f}",
-        'expected_usd_per_month': round(expected_btc_per_day * 30 * btc_price_usd, 2),
+        'expected_usd_per_month': round(usd_per_day * 30, 2),
         'energy_cost_per_day_usd': round(energy_cost_per_day, 2),
         'energy_cost_per_month_usd': round(energy_cost_per_day * 30, 2),
-        'net_profit_per_day_usd': round((expected_btc_per_day * btc_price_usd) - energy_cost_per_day, 2),
-        'net_profit_per_month_usd': round(((expected_btc_per_day * btc_price_usd) - energy_cost_per_day) * 30, 2),
-        'roi_years': round(1500 / (((expected_btc_per_day * btc_price_usd) - energy_cost_per_day) * 365), 2) if (expected_btc_per_day * btc_price_usd) > energy_cost_per_day and ((expected_btc_per_day * btc_price_usd) - energy_cost_per_day) > 0 else None,
+        'net_profit_per_day_usd': round(net_usd_per_day, 2),
+        'net_profit_per_month_usd': round(net_usd_per_day * 30, 2),
+        'roi_years': round(1500 / (net_usd_per_day * 365), 2) if net_usd_per_day > 0 else None,
         'assumptions': {
             'btc_price_usd': btc_price_usd,
             'network_hashrate_ehs': network_hashrate_ehs,
@@ -651,92 +936,104 @@ def overview_analytics(request):
     }
 
     # Performance Trends (hourly averages for last 24h)
-    from django.db.models.functions import TruncHour
 
-    # Combine Bitaxe and Avalon mining trends
-    bitaxe_hourly_mining = bitaxe_mining_recent.annotate(
-        hour=TruncHour('recorded_at')
-    ).values('hour').annotate(
-        avg_hashrate=Avg('hashrate_ghs'),
-        total_shares=Sum('shares_accepted'),
-    ).order_by('hour')
+    # Combine Bitaxe and Avalon mining trends. Each family is grouped per
+    # hour in SQL and the grouped rows come back through one UNION ALL
+    # statement, so the Python pass only folds together the at-most-two
+    # family rows per hour. (Per-side ordering must stay cleared for the
+    # union; the output lists are sorted by hour below anyway.) Summing the
+    # per-family hourly averages preserves the reported fleet-hashrate
+    # semantics, which a flat GROUP BY over the raw union would change.
+    # Where the Timescale continuous aggregates exist, the Bitaxe sides read
+    # the incrementally-maintained hourly rollups (O(hours x devices) rows)
+    # instead of re-scanning the raw tables on every poll. The rollup keys
+    # are aliased to 'hour' so both sides stay union-compatible with the
+    # Avalon raw-table queries.
+    if _timescale_caggs_available():
+        bitaxe_hourly_mining = BitAxeMiningStats1h.objects.filter(
+            bucket__gte=start_time_hours, bucket__lt=now
+        ).annotate(hour=F('bucket')).values('hour').annotate(
+            avg_hashrate=Avg('hashrate_ghs'),
+            total_shares=Sum('shares_accepted'),
+        ).order_by()
+    else:
+        bitaxe_hourly_mining = bitaxe_mining_recent.annotate(
+            hour=TruncHour('recorded_at')
+        ).values('hour').annotate(
+            avg_hashrate=Avg('hashrate_ghs'),
+            total_shares=Sum('shares_accepted'),
+        ).order_by()
 
     avalon_hourly_mining = avalon_mining_recent.annotate(
         hour=TruncHour('recorded_at')
     ).values('hour').annotate(
         avg_hashrate=Avg('hashrate_ghs'),
         total_shares=Sum('shares_accepted'),
-    ).order_by('hour')
-
-    # Combine Bitaxe and Avalon hardware trends
-    bitaxe_hourly_hardware = bitaxe_hardware_recent.annotate(
-        hour=TruncHour('recorded_at')
-    ).values('hour').annotate(
-        avg_temp=Avg('temperature_c'),
-        avg_power=Avg('power_watts'),
-    ).order_by('hour')
+    ).order_by()
+
+    # Combine Bitaxe and Avalon hardware trends (same single-statement form)
+    if _timescale_caggs_available():
+        bitaxe_hourly_hardware = BitAxeHardwareLog1h.objects.filter(
+            bucket__gte=start_time_hours, bucket__lt=now
+        ).annotate(hour=F('bucket')).values('hour').annotate(
+            avg_temp=Avg('temperature_c'),
+            avg_power=Avg('power_watts'),
+        ).order_by()
+    else:
+        bitaxe_hourly_hardware = bitaxe_hardware_recent.annotate(
+            hour=TruncHour('recorded_at')
+        ).values('hour').annotate(
+            avg_temp=Avg('temperature_c'),
+            avg_power=Avg('power_watts'),
+        ).order_by()
 
     avalon_hourly_hardware = avalon_hardware_recent.annotate(
         hour=TruncHour('recorded_at')
     ).values('hour').annotate(
         avg_temp=Avg('temperature_c'),
         avg_power=Avg('power_watts'),
-    ).order_by('hour')
-
-    # Combine hourly data for trends
+    ).order_by()
+
+    # The family rows are folded per hour with a pandas groupby instead of
+    # per-row dict merges: hashrate and shares sum across families, while
+    # temperature takes the plain mean of the family averages (what the old
+    # running merge computed). groupby sorts its keys, so the grouped
+    # frames come back in hour order and the response lists need no sort.
+    mining_rows = list(bitaxe_hourly_mining.union(avalon_hourly_mining, all=True))
     combined_hourly_mining = {}
-    combined_hourly_hardware = {}
-
-    # Aggregate Bitaxe hourly mining data
-    for item in bitaxe_hourly_mining:
-        hour_key = item['hour'].isoformat()
-        combined_hourly_mining[hour_key] = {
-            'hour': hour_key,
-            'hashrate_ghs': item['avg_hashrate'] or 0,
-            'shares': item['total_shares'] or 0,
-        }
-
-    # Add Avalon hourly mining data
-    for item in avalon_hourly_mining:
-        hour_key = item['hour'].isoformat()
-        if hour_key in combined_hourly_mining:
-            combined_hourly_mining[hour_key]['hashrate_ghs'] += item['avg_hashrate'] or 0
-            combined_hourly_mining[hour_key]['shares'] += item['total_shares'] or 0
-        else:
-            combined_hourly_mining[hour_key] = {
-                'hour': hour_key,
-                'hashrate_ghs': item['avg_hashrate'] or 0,
-                'shares': item['total_shares'] or 0,
+    hourly_hashrate = []
+    if mining_rows:
+        mining_df = pd.DataFrame(mining_rows).groupby('hour').agg(
+            hashrate_ghs=('avg_hashrate', 'sum'),
+            shares=('total_shares', 'sum'),
+        )
+        # Keyed by the raw hour datetime so the best-share merge below can
+        # look entries up without re-stringifying; each entry formats its
+        # hour exactly once.
+        for row in mining_df.itertuples():
+            entry = {
+                'hour': row.Index.isoformat(),
+                'hashrate_ghs': round(float(row.hashrate_ghs), 2),
+                'shares': int(row.shares),
             }
-
-    # Aggregate Bitaxe hourly hardware data
-    for item in bitaxe_hourly_hardware:
-        hour_key = item['hour'].isoformat()
-        combined_hourly_hardware[hour_key] = {
-            'hour': hour_key,
-            'temperature_c': item['avg_temp'] or 0,
-            'power_watts': item['avg_power'] or 0,
-            'device_count': 1,
-        }
-
-    # Add Avalon hourly hardware data (weighted average for temperature)
-    for item in avalon_hourly_hardware:
-        hour_key = item['hour'].isoformat()
-        if hour_key in combined_hourly_hardware:
-            # Weighted average for temperature, sum for power
-            old_temp = combined_hourly_hardware[hour_key]['temperature_c']
-            old_count = combined_hourly_hardware[hour_key]['device_count']
-            new_temp = (old_temp * old_count + (item['avg_temp'] or 0)) / (old_count + 1)
-            combined_hourly_hardware[hour_key]['temperature_c'] = new_temp
-            combined_hourly_hardware[hour_key]['power_watts'] += item['avg_power'] or 0
-            combined_hourly_hardware[hour_key]['device_count'] += 1
-        else:
-            combined_hourly_hardware[hour_key] = {
-                'hour': hour_key,
-                'temperature_c': item['avg_temp'] or 0,
-                'power_watts': item['avg_power'] or 0,
-                'device_count': 1,
+            combined_hourly_mining[row.Index] = entry
+            hourly_hashrate.append(entry)
+
+    hardware_rows = list(bitaxe_hourly_hardware.union(avalon_hourly_hardware, all=True))
+    hourly_hardware = []
+    if hardware_rows:
+        hardware_df = pd.DataFrame(hardware_rows).groupby('hour').agg(
+            temperature_c=('avg_temp', 'mean'),
+            power_watts=('avg_power', 'sum'),
+        )
+        hourly_hardware = [
+            {
+                'hour': row.Index.isoformat(),
+                'temperature_c': round(float(row.temperature_c), 1),
+                'power_watts': round(float(row.power_watts), 1),
             }
+            for row in hardware_df.itertuples()
+        ]
 
     # Best Share Trends (hourly maximums for last 24h)
     bitaxe_hourly_best_shares = bitaxe_mining_recent.filter(
@@ -744,8 +1041,8 @@ def overview_analytics(request):
     ).annotate(
         hour=TruncHour('recorded_at')
     ).values('hour').annotate(
-        best_share_difficulty=Max('best_difficulty'),
-        device_name=Max('device__device_name'),
+        best_share_difficulty=Coalesce(Max('best_difficulty'), 0),
+        device_name=Coalesce(Max('device__device_name'), Value('Unknown')),
     ).order_by('hour')
 
     # For Avalon, we'll use the general difficulty field as best share if available
@@ -755,86 +1052,64 @@ def overview_analytics(request):
     ).annotate(
         hour=TruncHour('recorded_at')
     ).values('hour').annotate(
-        best_share_difficulty=Max('difficulty'),
-        device_name=Max('device__device_name'),
+        best_share_difficulty=Coalesce(Max('difficulty'), 0.0),
+        device_name=Coalesce(Max('device__device_name'), Value('Unknown')),
     ).order_by('hour')
 
     # Combine best share data - merge both devices into single hourly entries
     combined_hourly_best_shares = {}
 
-    # Initialize all hours from combined mining data
-    for hour_key in combined_hourly_mining.keys():
-        combined_hourly_best_shares[hour_key] = {
-            'hour': hour_key,
-            'bitaxe_best_share': 0,
-            'bitaxe_device_name': None,
-            'avalon_best_share': 0,
-            'avalon_device_name': None,
-            'hashrate_ghs': combined_hourly_mining[hour_key].get('hashrate_ghs', 0),
-        }
+    # Initialize all hours from combined mining data. Keys stay raw
+    # datetimes throughout the merge; the precomputed entry['hour'] string
+    # is reused rather than re-formatted per lookup.
+    for hour_key, mining_entry in combined_hourly_mining.items():
+        combined_hourly_best_shares[hour_key] = _HourlyBestShares(
+            hour=mining_entry['hour'],
+            hashrate_ghs=mining_entry['hashrate_ghs'],
+        )
 
     # Add Bitaxe best shares
     for item in bitaxe_hourly_best_shares:
-        hour_key = item['hour'].isoformat()
-        if hour_key in combined_hourly_best_shares:
-            combined_hourly_best_shares[hour_key]['bitaxe_best_share'] = item['best_share_difficulty'] or 0
-            combined_hourly_best_shares[hour_key]['bitaxe_device_name'] = item['device_name'] or 'Unknown'
-        else:
-            combined_hourly_best_shares[hour_key] = {
-                'hour': hour_key,
-                'bitaxe_best_share': item['best_share_difficulty'] or 0,
-                'bitaxe_device_name': item['device_name'] or 'Unknown',
-                'avalon_best_share': 0,
-                'avalon_device_name': None,
-                'hashrate_ghs': combined_hourly_mining.get(hour_key, {}).get('hashrate_ghs', 0),
-            }
+        hour_key = item['hour']
+        entry = combined_hourly_best_shares.get(hour_key)
+        if entry is None:
+            entry = combined_hourly_best_shares[hour_key] = _HourlyBestShares(
+                hour=hour_key.isoformat(),
+            )
+        entry.bitaxe_best_share = item['best_share_difficulty']
+        entry.bitaxe_device_name = item['device_name']
 
     # Add Avalon best shares
     for item in avalon_hourly_best_shares:
-        hour_key = item['hour'].isoformat()
-        if hour_key in combined_hourly_best_shares:
-            combined_hourly_best_shares[hour_key]['avalon_best_share'] = item['best_share_difficulty'] or 0
-            combined_hourly_best_shares[hour_key]['avalon_device_name'] = item['device_name'] or 'Unknown'
-        else:
-            combined_hourly_best_shares[hour_key] = {
-                'hour': hour_key,
-                'bitaxe_best_share': 0,
-                'bitaxe_device_name': None,
-                'avalon_best_share': item['best_share_difficulty'] or 0,
-                'avalon_device_name': item['device_name'] or 'Unknown',
-                'hashrate_ghs': combined_hourly_mining.get(hour_key, {}).get('hashrate_ghs', 0),
-            }
+        hour_key = item['hour']
+        entry = combined_hourly_best_shares.get(hour_key)
+        if entry is None:
+            entry = combined_hourly_best_shares[hour_key] = _HourlyBestShares(
+                hour=hour_key.isoformat(),
+            )
+        entry.avalon_best_share = item['best_share_difficulty']
+        entry.avalon_device_name = item['device_name']
 
     result['trends'] = {
-        'hourly_hashrate': [
-            {
-                'hour': data['hour'],
-                'hashrate_ghs': round(data['hashrate_ghs'], 2),
-                'shares': data['shares'],
-            }
-            for data in sorted(combined_hourly_mining.values(), key=lambda x: x['hour'])
-        ],
-        'hourly_hardware': [
-            {
-                'hour': data['hour'],
-                'temperature_c': round(data['temperature_c'], 1),
-                'power_watts': round(data['power_watts'], 1),
-            }
-            for data in sorted(combined_hourly_hardware.values(), key=lambda x: x['hour'])
-        ],
+        'hourly_hashrate': hourly_hashrate,
+        'hourly_hardware': hourly_hardware,
         'hourly_best_shares': [
             {
-                'hour': data['hour'],
-                'bitaxe_best_share': data['bitaxe_best_share'],
-                'bitaxe_device_name': data['bitaxe_device_name'],
-                'avalon_best_share': data['avalon_best_share'],
-                'avalon_device_name': data['avalon_device_name'],
-                'hashrate_ghs': round(data['hashrate_ghs'], 2),
+                'hour': data.hour,
+                'bitaxe_best_share': data.bitaxe_best_share,
+                'bitaxe_device_name': data.bitaxe_device_name,
+                'avalon_best_share': data.avalon_best_share,
+                'avalon_device_name': data.avalon_device_name,
+                'hashrate_ghs': round(data.hashrate_ghs, 2),
             }
-            for data in sorted(combined_hourly_best_shares.values(), key=lambda x: x['hour'])
+            for data in (
+                combined_hourly_best_shares[key]
+                for key in sorted(combined_hourly_best_shares)
+            )
         ],
     }
 
+    cache.set(cache_key, result, timeout=_analytics_cache_timeout())
     return Response(result)
 
 
@@ -910,6 +1185,28 @@ def csrf_token_view(request):
     return Response({'csrfToken': csrf_token})
 
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def auth_bootstrap_view(request):
+    """
+    Single boot endpoint for the SPA: CSRF token plus session state.
+    Replaces the separate csrf + current-user round trips on page load.
+    """
+    from django.middleware.csrf import get_token
+    user = None
+    if request.user.is_authenticated:
+        user = {
+            'id': request.user.id,
+            'username': request.user.username,
+            'email': request.user.email,
+        }
+    return Response({
+        'csrfToken': get_token(request),
+        'authenticated': request.user.is_authenticated,
+        'user': user,
+    })
+
+
 # Data Collector Settings Views
 @api_view(['GET', 'POST'])
 @permission_classes([IsAuthenticated])
@@ -981,12 +1278,25 @@ def refresh_network_data(request):
         network_difficulty = None
         errors = []
 
-        # Fetch BTC price from CoinGecko (free, no API key required)
-        try:
-            price_response = requests.get(
+        # The two upstream fetches are independent and purely latency-bound,
+        # so they run overlapped: wall-time is the slower of the two calls
+        # instead of their sum. Errors surface through .result() inside the
+        # per-source try blocks below, exactly as the serial calls did.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            price_future = executor.submit(
+                requests.get,
                 'https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd',
                 timeout=10
             )
+            hashrate_future = executor.submit(
+                requests.get,
+                'https://mempool.space/api/v1/mining/hashrate/3d',
+                timeout=10
+            )
+
+        # Fetch BTC price from CoinGecko (free, no API key required)
+        try:
+            price_response = price_future.result()
             if price_response.ok:
                 price_data = price_response.json()
                 btc_price = price_data.get('bitcoin', {}).get('usd')
@@ -999,10 +1309,7 @@ def refresh_network_data(request):
 
         # Fetch network stats from mempool.space (free, no API key required)
         try:
-            hashrate_response = requests.get(
-                'https://mempool.space/api/v1/mining/hashrate/3d',
-                timeout=10
-            )
+            hashrate_response = hashrate_future.result()
             if hashrate_response.ok:
                 hashrate_data = hashrate_response.json()
                 # Get latest hashrate (in H/s), convert to EH/s
@@ -1044,6 +1351,7 @@ def refresh_network_data(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer])
 def get_network_data(request):
     """
     Get cached network data (BTC price, hashrate, difficulty).
@@ -1080,6 +1388,9 @@ def trigger_collector_poll(request):
     try:
         response = requests.post(f'{data_service_url}/poll', timeout=60)
         if response.ok:
+            # Fresh data just landed; drop the cached analytics payloads
+            # so the next dashboard fetch sees it immediately.
+            _invalidate_analytics_cache()
             return Response({
                 'success': True,
                 'message': 'Poll cycle triggered successfully',
@@ -1099,6 +1410,7 @@ def trigger_collector_poll(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer])
 def detailed_analytics(request):
     """
     Advanced analytics endpoint for the Analytics Dashboard.
@@ -1109,15 +1421,26 @@ def detailed_analytics(request):
     - Cross-device comparisons
     - Predictive insights
     """
-    import math
-
     from django.db.models.functions import TruncDay, TruncHour
 
     hours = int(request.query_params.get('hours', 24))
     days = int(request.query_params.get('days', 7))
 
-    start_time_hours = timezone.now() - timedelta(hours=hours)
-    start_time_days = timezone.now() - timedelta(days=days)
+    # Same short-TTL response cache as overview_analytics: the data only
+    # moves when the collector writes, so within a TTL window one build
+    # serves every dashboard poll. ?nocache=1 bypasses for debugging.
+    cache_key = _analytics_cache_key('detailed_analytics_v1', hours, days)
+    if request.query_params.get('nocache') != '1':
+        cached_result = cache.get(cache_key)
+        if cached_result is not None:
+            return Response(cached_result)
+
+    # One clock read for the whole request: every range below shares the
+    # same [start, now) bound, which also gives the planner a closed range
+    # for chunk exclusion on partitioned tables.
+    now = timezone.now()
+    start_time_hours = now - timedelta(hours=hours)
+    start_time_days = now - timedelta(days=days)
 
     # Get all active devices
     bitaxe_devices = BitAxeDevice.objects.filter(is_active=True)
@@ -1134,198 +1457,172 @@ def detailed_analytics(request):
     }
 
     # === ENERGY ANALYSIS ===
-    # Get current and historical power consumption
-    current_power_total = 0
-    device_power_data = []
-
-    for device in bitaxe_devices:
-        latest_hw = BitAxeHardwareLog.objects.filter(device=device).first()
-        latest_mining = BitAxeMiningStats.objects.filter(device=device).first()
-        if latest_hw:
-            power = latest_hw.power_watts or 0
-            hashrate = latest_mining.hashrate_ghs if latest_mining else 0
-            current_power_total += power
-            device_power_data.append({
-                'device_name': device.device_name,
-                'device_type': 'Bitaxe',
-                'power_watts': round(power, 1),
-                'hashrate_ghs': round(hashrate, 2),
-                'efficiency_w_per_gh': round(power / hashrate, 2) if hashrate > 0 else 0,
-                'efficiency_j_per_th': round((power / hashrate) * 1000, 2) if hashrate > 0 else 0,
-            })
-
-    for device in avalon_devices:
-        latest_hw = AvalonHardwareLogs.objects.filter(device=device).first()
-        latest_mining = AvalonMiningStats.objects.filter(device=device).first()
-        if latest_hw:
-            power = latest_hw.power_watts or 0
-            hashrate = latest_mining.hashrate_ghs if latest_mining else 0
-            current_power_total += power
-            device_power_data.append({
-                'device_name': device.device_name,
-                'device_type': 'Avalon',
-                'power_watts': round(power, 1),
-                'hashrate_ghs': round(hashrate, 2),
-                'efficiency_w_per_gh': round(power / hashrate, 2) if hashrate > 0 else 0,
-                'efficiency_j_per_th': round((power / hashrate) * 1000, 2) if hashrate > 0 else 0,
-            })
+    # Get current and historical power consumption. One latest-row-per-device
+    # query per table (see _latest_per_device) replaces the old two queries
+    # per device; the device list falls out of the hardware rows themselves.
+    device_meta = []
+    power_readings = []
+    hashrate_readings = []
+
+    for family, hw_model, mining_model in (
+        ('Bitaxe', BitAxeHardwareLog, BitAxeMiningStats),
+        ('Avalon', AvalonHardwareLogs, AvalonMiningStats),
+    ):
+        latest_hashrates = dict(
+            _latest_per_device(mining_model).filter(
+                device__is_active=True
+            ).values_list('device_id', 'hashrate_ghs')
+        )
+        for hw in _latest_per_device(hw_model).filter(
+            device__is_active=True
+        ).select_related('device').only('power_watts', 'device__device_name'):
+            device_meta.append((hw.device.device_name, family))
+            power_readings.append(hw.power_watts or 0)
+            hashrate_readings.append(latest_hashrates.get(hw.device_id) or 0)
+
+    # The per-device arithmetic is column-wise: both efficiency figures
+    # share one guarded power/hashrate ratio, computed and rounded across
+    # the fleet in a single pass instead of per row. The float() casts
+    # keep the payload plain-JSON types.
+    power_arr = np.asarray(power_readings, dtype=float)
+    hashrate_arr = np.asarray(hashrate_readings, dtype=float)
+    eff_arr = np.divide(
+        power_arr, hashrate_arr,
+        out=np.zeros_like(power_arr), where=hashrate_arr > 0
+    )
+    current_power_total = float(power_arr.sum())
+    device_power_data = [
+        {
+            'device_name': name,
+            'device_type': family,
+            'power_watts': float(power),
+            'hashrate_ghs': float(hashrate),
+            'efficiency_w_per_gh': float(eff_w),
+            'efficiency_j_per_th': float(eff_j),
+        }
+        for (name, family), power, hashrate, eff_w, eff_j in zip(
+            device_meta,
+            np.round(power_arr, 1),
+            np.round(hashrate_arr, 2),
+            np.round(eff_arr, 2),
+            np.round(eff_arr * 1000, 2),
+        )
+    ]
 
-    # Historical power data (hourly averages)
+    # Historical power data (hourly averages). Each family is grouped per
+    # hour in SQL and the grouped rows come back through one UNION ALL
+    # statement (per-side ordering cleared, as the compound statement
+    # requires), so the Python pass only folds the at-most-two family rows
+    # per hour instead of merging two full result sets.
     bitaxe_power_trend = BitAxeHardwareLog.objects.filter(
-        recorded_at__gte=start_time_hours
+        recorded_at__gte=start_time_hours, recorded_at__lt=now
     ).annotate(hour=TruncHour('recorded_at')).values('hour').annotate(
         avg_power=Avg('power_watts'),
         avg_temp=Avg('temperature_c'),
-    ).order_by('hour')
+    ).order_by()
 
     avalon_power_trend = AvalonHardwareLogs.objects.filter(
-        recorded_at__gte=start_time_hours
+        recorded_at__gte=start_time_hours, recorded_at__lt=now
     ).annotate(hour=TruncHour('recorded_at')).values('hour').annotate(
         avg_power=Avg('power_watts'),
         avg_temp=Avg('temperature_c'),
-    ).order_by('hour')
-
-    # Combine power trends
-    power_by_hour = {}
-    for item in bitaxe_power_trend:
-        hour_key = item['hour'].isoformat()
-        power_by_hour[hour_key] = {
-            'hour': hour_key,
-            'power_watts': item['avg_power'] or 0,
-            'temperature_c': item['avg_temp'] or 0,
-        }
-    for item in avalon_power_trend:
-        hour_key = item['hour'].isoformat()
-        if hour_key in power_by_hour:
-            power_by_hour[hour_key]['power_watts'] += item['avg_power'] or 0
-            power_by_hour[hour_key]['temperature_c'] = (
-                power_by_hour[hour_key]['temperature_c'] + (item['avg_temp'] or 0)
-            ) / 2
-        else:
-            power_by_hour[hour_key] = {
-                'hour': hour_key,
-                'power_watts': item['avg_power'] or 0,
-                'temperature_c': item['avg_temp'] or 0,
+    ).order_by()
+
+    # Sum power, average temperature across families with a pandas groupby
+    # (same fold as the overview trends); the grouped frame comes back in
+    # hour order.
+    power_rows = list(bitaxe_power_trend.union(avalon_power_trend, all=True))
+    power_trend = []
+    if power_rows:
+        power_df = pd.DataFrame(power_rows).groupby('hour').agg(
+            power_watts=('avg_power', 'sum'),
+            temperature_c=('avg_temp', 'mean'),
+        )
+        power_trend = [
+            {
+                'hour': row.Index.isoformat(),
+                'power_watts': float(row.power_watts),
+                'temperature_c': float(row.temperature_c),
             }
+            for row in power_df.itertuples()
+        ]
 
     result['energy_analysis'] = {
         'current_power_watts': round(current_power_total, 1),
         'current_power_kw': round(current_power_total / 1000, 3),
         'devices': sorted(device_power_data, key=lambda x: x['power_watts'], reverse=True),
-        'power_trend': sorted(power_by_hour.values(), key=lambda x: x['hour']),
+        'power_trend': power_trend,
     }
 
     # === BEST DIFFICULTY PREDICTION ===
     # Get current hashrate (total across all devices)
     total_hashrate_ghs = sum(d['hashrate_ghs'] for d in device_power_data)
-    total_hashrate_hs = total_hashrate_ghs * 1e9  # Convert GH/s to H/s
 
-    # Get historical best difficulties to analyze patterns
+    # Historical best difficulties to analyze patterns
     bitaxe_best_shares = BitAxeMiningStats.objects.filter(
         best_difficulty__isnull=False,
         best_difficulty__gt=0
-    ).order_by('-best_difficulty')[:100]
-
-    avalon_best_shares = AvalonMiningStats.objects.filter(
-        difficulty__gt=1000
-    ).order_by('-difficulty')[:100]
-
-    # All-time best share - check BOTH Bitaxe and Avalon devices
-    bitaxe_best = bitaxe_best_shares.first()
-    avalon_best = avalon_best_shares.first()
+    )
+    avalon_best_shares = AvalonMiningStats.objects.filter(difficulty__gt=1000)
+
+    # All-time best share - check BOTH Bitaxe and Avalon devices. One
+    # aggregate per family gets the record difficulty and the record count
+    # (reported further down) in the same round trip; only the winning
+    # family then needs an index seek for the record's timestamp.
+    bitaxe_best_agg = bitaxe_best_shares.aggregate(
+        best=Max('best_difficulty'), total=Count('id')
+    )
+    avalon_best_agg = avalon_best_shares.aggregate(
+        best=Max('difficulty'), total=Count('id')
+    )
 
-    bitaxe_best_diff = int(bitaxe_best.best_difficulty) if bitaxe_best and bitaxe_best.best_difficulty else 0
-    avalon_best_diff = int(avalon_best.difficulty) if avalon_best and avalon_best.difficulty else 0
+    bitaxe_best_diff = int(bitaxe_best_agg['best'] or 0)
+    avalon_best_diff = int(avalon_best_agg['best'] or 0)
 
     # Use the higher of the two
     if bitaxe_best_diff >= avalon_best_diff:
-        all_time_best = bitaxe_best
         all_time_best_difficulty = bitaxe_best_diff
         all_time_best_source = 'Bitaxe'
+        all_time_best_recorded_at = bitaxe_best_shares.filter(
+            best_difficulty=bitaxe_best_agg['best']
+        ).values_list('recorded_at', flat=True).first() if bitaxe_best_diff else None
     else:
-        all_time_best = avalon_best
         all_time_best_difficulty = avalon_best_diff
         all_time_best_source = 'Avalon'
+        all_time_best_recorded_at = avalon_best_shares.filter(
+            difficulty=avalon_best_agg['best']
+        ).values_list('recorded_at', flat=True).first()
 
     # Debug logging
     logger.info(f"Analytics: total_hashrate_ghs={total_hashrate_ghs}, all_time_best_difficulty={all_time_best_difficulty}, source={all_time_best_source}")
 
-    # Calculate probability of finding a share above current best
-    #
-    # IMPORTANT: Share difficulty is NOT the same as the number of hashes needed.
-    # In Bitcoin mining, share difficulty D means you need on average 2^32 * D hashes
-    # to find a share that meets that difficulty.
-    #
-    # Probability of a single hash meeting difficulty D = 1 / (2^32 * D)
-    # Expected hashes to beat difficulty D = 2^32 * D
-    # Expected time to beat D = (2^32 * D) / hashrate_hs
-
-    if total_hashrate_hs > 0 and all_time_best_difficulty > 0:
-        # Bitcoin share difficulty calculation:
-        #
-        # In Bitcoin, difficulty D means you need to find a hash below target = 2^256 / (D * 2^32)
-        # The probability of a single hash meeting difficulty D is: 1 / (D * 2^32)
-        #
-        # Expected number of hashes to find a share with difficulty >= D: D * 2^32
-        # Expected time: (D * 2^32) / hashrate_hs seconds
-        #
-        # 2^32 = 4,294,967,296 ≈ 4.295 billion
-
-        TWO_POW_32 = 4294967296  # 2^32
-
-        # Expected time to find a share equal to or better than current best
-        expected_seconds = (all_time_best_difficulty * TWO_POW_32) / total_hashrate_hs
-        expected_hours = expected_seconds / 3600
-        expected_days = expected_hours / 24
-
-        # Probability of beating current best within a time period
-        # Using exponential distribution: P(T <= t) = 1 - exp(-t/E[T])
-        # E[T] = (D * 2^32) / hashrate
-        # P = 1 - exp(-t * hashrate / (D * 2^32))
-
-        # Calculate lambda = hashrate / (difficulty * 2^32) (rate parameter)
-        lambda_rate = total_hashrate_hs / (all_time_best_difficulty * TWO_POW_32)
-
-        # Probability of beating current best within next hour
-        prob_beat_1h = 1 - math.exp(-3600 * lambda_rate)
-        # Probability within next 24 hours
-        prob_beat_24h = 1 - math.exp(-86400 * lambda_rate)
-        # Probability within next 7 days
-        prob_beat_7d = 1 - math.exp(-604800 * lambda_rate)
-
-        # Clamp probabilities to avoid floating point issues showing > 100%
-        prob_beat_1h = min(max(prob_beat_1h, 0), 1)
-        prob_beat_24h = min(max(prob_beat_24h, 0), 1)
-        prob_beat_7d = min(max(prob_beat_7d, 0), 1)
+    # Probability of finding a share above the current best: a memoized pure
+    # function of the (GH/s-quantized) fleet hashrate and the record
+    # difficulty, see _best_share_outlook.
+    (expected_hours, expected_days,
+     prob_beat_1h, prob_beat_24h, prob_beat_7d) = _best_share_outlook(
+        int(round(total_hashrate_ghs)), all_time_best_difficulty
+    )
 
+    if expected_hours:
         # Log the calculated values for debugging
         logger.info(f"Analytics: expected_hours={expected_hours:.2f}, prob_1h={prob_beat_1h*100:.4f}%, prob_24h={prob_beat_24h*100:.4f}%, prob_7d={prob_beat_7d*100:.4f}%")
 
-        # The "Expected Best" values are removed - they were confusing.
-        # Instead, we focus on the key question: "When will I beat my current best?"
-        #
-        # This is answered by:
-        # - expected_time_to_beat (already calculated above)
-        # - probability_to_beat_current_best (already calculated above)
-        #
-        # Setting these to 0 as they're not meaningful to display
-        expected_best_in_1d = 0
-        expected_best_in_7d = 0
-        expected_best_in_30d = 0
-    else:
-        expected_hours = 0
-        expected_days = 0
-        prob_beat_1h = 0
-        prob_beat_24h = 0
-        prob_beat_7d = 0
-        expected_best_in_1d = 0
-        expected_best_in_7d = 0
-        expected_best_in_30d = 0
-
-    # Recent best shares timeline (last 30 days)
-    thirty_days_ago = timezone.now() - timedelta(days=30)
+    # The "Expected Best" values are removed - they were confusing.
+    # Instead, we focus on the key question: "When will I beat my current
+    # best?", answered by expected_time_to_beat and
+    # probability_to_beat_current_best above. Kept at 0 as they're not
+    # meaningful to display.
+    expected_best_in_1d = 0
+    expected_best_in_7d = 0
+    expected_best_in_30d = 0
+
+    # Recent best shares timeline (last 30 days). Both families come back
+    # per day through one UNION ALL statement (per-side ordering cleared,
+    # as the compound statement requires).
+    thirty_days_ago = now - timedelta(days=30)
     recent_bitaxe_bests = BitAxeMiningStats.objects.filter(
-        recorded_at__gte=thirty_days_ago,
+        recorded_at__gte=thirty_days_ago, recorded_at__lt=now,
     ).filter(
         Q(best_difficulty__isnull=False, best_difficulty__gt=0) |
         Q(best_session_difficulty__isnull=False, best_session_difficulty__gt=0)
@@ -1333,52 +1630,61 @@ def detailed_analytics(request):
         max_best_ever=Max('best_difficulty'),           # All-time best
         max_best_session=Max('best_session_difficulty'), # Session best
         device_name=Max('device__device_name'),
-    ).order_by('day')
+        kind=Value('Bitaxe', output_field=CharField()),
+    ).order_by()
 
+    # Avalon doesn't have session tracking, so its difficulty stands in
+    # for both columns (the union maps them onto the Bitaxe column names).
     recent_avalon_bests = AvalonMiningStats.objects.filter(
-        recorded_at__gte=thirty_days_ago,
+        recorded_at__gte=thirty_days_ago, recorded_at__lt=now,
         difficulty__gt=1000
     ).annotate(day=TruncDay('recorded_at')).values('day').annotate(
         max_difficulty=Max('difficulty'),
+        max_session=Max('difficulty'),
         device_name=Max('device__device_name'),
-    ).order_by('day')
-
-    # Combine daily best shares
-    daily_bests = {}
-    for item in recent_bitaxe_bests:
-        day_key = item['day'].isoformat()
-        daily_bests[day_key] = {
-            'date': day_key,
-            'best_difficulty': item['max_best_ever'] or 0,
-            'best_session_difficulty': item['max_best_session'] or 0,
-            'device_name': item['device_name'],
-            'device_type': 'Bitaxe',
-        }
-    for item in recent_avalon_bests:
-        day_key = item['day'].isoformat()
-        # Avalon doesn't have session tracking, so use difficulty for both
-        if day_key not in daily_bests or item['max_difficulty'] > daily_bests[day_key]['best_difficulty']:
-            daily_bests[day_key] = {
-                'date': day_key,
-                'best_difficulty': item['max_difficulty'],
-                'best_session_difficulty': item['max_difficulty'],  # Same as best for Avalon
-                'device_name': item['device_name'],
+        kind=Value('Avalon', output_field=CharField()),
+    ).order_by()
+
+    # Pair up the per-day family rows, then decide each day's winner in one
+    # place: the higher daily best takes the row (Bitaxe on ties, as
+    # before), and a losing Avalon best can still set the session figure.
+    family_bests_by_day = {}
+    for item in recent_bitaxe_bests.union(recent_avalon_bests, all=True):
+        family_bests_by_day.setdefault(item['day'], {})[item['kind']] = item
+
+    sorted_daily_bests = []
+    for day in sorted(family_bests_by_day):
+        families = family_bests_by_day[day]
+        bitaxe = families.get('Bitaxe')
+        avalon = families.get('Avalon')
+        bitaxe_day_best = (bitaxe['max_best_ever'] or 0) if bitaxe else 0
+        avalon_day_best = avalon['max_best_ever'] if avalon else 0
+        if avalon and avalon_day_best > bitaxe_day_best:
+            entry = {
+                'date': day.isoformat(),
+                'best_difficulty': avalon_day_best,
+                'best_session_difficulty': avalon_day_best,
+                'device_name': avalon['device_name'],
                 'device_type': 'Avalon',
             }
-        elif day_key in daily_bests:
-            # Keep existing best_difficulty but update session if Avalon has higher
-            if item['max_difficulty'] > daily_bests[day_key].get('best_session_difficulty', 0):
-                daily_bests[day_key]['best_session_difficulty'] = item['max_difficulty']
-
-    # Sort daily bests by date
-    sorted_daily_bests = sorted(daily_bests.values(), key=lambda x: x['date'])
+        else:
+            entry = {
+                'date': day.isoformat(),
+                'best_difficulty': bitaxe_day_best,
+                'best_session_difficulty': max(
+                    bitaxe['max_best_session'] or 0, avalon_day_best
+                ),
+                'device_name': bitaxe['device_name'],
+                'device_type': 'Bitaxe',
+            }
+        sorted_daily_bests.append(entry)
 
     result['best_difficulty_prediction'] = {
         'current_hashrate_ghs': round(total_hashrate_ghs, 2),
         'current_hashrate_ths': round(total_hashrate_ghs / 1000, 4),
         'all_time_best_difficulty': all_time_best_difficulty,
         'all_time_best_formatted': _format_difficulty(all_time_best_difficulty),
-        'all_time_best_timestamp': all_time_best.recorded_at.isoformat() if all_time_best else None,
+        'all_time_best_timestamp': all_time_best_recorded_at.isoformat() if all_time_best_recorded_at else None,
         'expected_time_to_beat': {
             'hours': round(expected_hours, 1),
             'days': round(expected_days, 1),
@@ -1403,9 +1709,6 @@ def detailed_analytics(request):
     # === HISTORICAL BEST SHARES ANALYSIS ===
     # Top 10 best shares ever - group by device and difficulty to avoid duplicates
     # Use distinct values and get the first occurrence of each unique best_difficulty per device
-    from django.db.models import F, Window
-    from django.db.models.functions import RowNumber
-
     # For Bitaxe: Get unique (device, best_difficulty) combinations with earliest timestamp
     bitaxe_unique_bests = BitAxeMiningStats.objects.filter(
         best_difficulty__isnull=False,
@@ -1413,54 +1716,46 @@ def detailed_analytics(request):
     ).values('device__device_name', 'best_difficulty').annotate(
         first_timestamp=Min('recorded_at'),
         hashrate=Avg('hashrate_ghs'),
-    ).order_by('-best_difficulty')[:20]  # Get more to allow for dedup
+        kind=Value('Bitaxe', output_field=CharField()),
+    ).order_by()
 
-    # For Avalon: Get unique (device, difficulty) combinations
+    # For Avalon: Get unique (device, difficulty) combinations. Columns
+    # line up positionally with the Bitaxe side for the UNION ALL below.
     avalon_unique_bests = AvalonMiningStats.objects.filter(
         difficulty__gt=1000
     ).values('device__device_name', 'difficulty').annotate(
         first_timestamp=Min('recorded_at'),
         hashrate=Avg('hashrate_ghs'),
-    ).order_by('-difficulty')[:20]
-
-    top_shares = []
-    seen_difficulties = set()  # Track seen difficulties to avoid exact duplicates
-
-    for share in bitaxe_unique_bests:
-        diff = share['best_difficulty']
-        # Create a unique key combining device and difficulty
-        key = (share['device__device_name'], diff)
-        if key not in seen_difficulties:
-            seen_difficulties.add(key)
-            top_shares.append({
-                'difficulty': diff,
-                'difficulty_formatted': _format_difficulty(diff),
-                'device_name': share['device__device_name'],
-                'device_type': 'Bitaxe',
-                'timestamp': share['first_timestamp'].isoformat() if share['first_timestamp'] else None,
-                'hashrate_at_time': round(share['hashrate'] or 0, 2),
-            })
-
-    for share in avalon_unique_bests:
-        diff = share['difficulty']
-        key = (share['device__device_name'], diff)
-        if key not in seen_difficulties:
-            seen_difficulties.add(key)
-            top_shares.append({
-                'difficulty': diff,
-                'difficulty_formatted': _format_difficulty(diff),
-                'device_name': share['device__device_name'],
-                'device_type': 'Avalon',
-                'timestamp': share['first_timestamp'].isoformat() if share['first_timestamp'] else None,
-                'hashrate_at_time': round(share['hashrate'] or 0, 2),
-            })
-
-    top_shares = sorted(top_shares, key=lambda x: x['difficulty'], reverse=True)[:10]
+        kind=Value('Avalon', output_field=CharField()),
+    ).order_by()
+
+    # The GROUP BY above already yields one row per (device, difficulty),
+    # so no Python-side dedup is needed. The sides stay unsliced because
+    # SQLite forbids LIMIT inside compound statements; the union's own
+    # ORDER BY + LIMIT still means at most ten rows reach Python. Result
+    # keys follow the first queryset (best_difficulty, also for Avalon
+    # rows).
+    top_shares = [
+        {
+            'difficulty': share['best_difficulty'],
+            'difficulty_formatted': _format_difficulty(share['best_difficulty']),
+            'device_name': share['device__device_name'],
+            'device_type': share['kind'],
+            'timestamp': share['first_timestamp'].isoformat() if share['first_timestamp'] else None,
+            'hashrate_at_time': round(share['hashrate'] or 0, 2),
+        }
+        for share in bitaxe_unique_bests.union(
+            avalon_unique_bests, all=True
+        ).order_by('-best_difficulty')[:10]
+    ]
 
     result['historical_best_shares'] = {
         'top_10': top_shares,
-        'total_records_bitaxe': bitaxe_best_shares.count(),
-        'total_records_avalon': avalon_best_shares.count(),
+        # The old sliced querysets reported at most 100 records; keep that
+        # cap. The counts came back with the all-time-best aggregates, so
+        # no extra COUNT(*) round trips here.
+        'total_records_bitaxe': min(bitaxe_best_agg['total'], 100),
+        'total_records_avalon': min(avalon_best_agg['total'], 100),
     }
 
     # === COST ANALYSIS ===
@@ -1476,15 +1771,14 @@ def detailed_analytics(request):
     network_difficulty = float(settings.cached_network_difficulty)
     network_data_updated = settings.network_data_updated_at
 
-    # Daily/monthly energy calculations
+    # Daily/monthly/yearly energy calculations, vectorized over the
+    # period-scale vector and unpacked back to plain floats; rounding
+    # still happens only at emit time so the derived ratios below keep
+    # full precision.
     power_kw = current_power_total / 1000
-    daily_kwh = power_kw * 24
-    monthly_kwh = daily_kwh * 30
-    yearly_kwh = daily_kwh * 365
-
-    daily_cost = daily_kwh * kwh_price
-    monthly_cost = monthly_kwh * kwh_price
-    yearly_cost = yearly_kwh * kwh_price
+    kwh = power_kw * 24 * _PERIOD_SCALE
+    daily_kwh, monthly_kwh, yearly_kwh = (float(v) for v in kwh)
+    daily_cost, monthly_cost, yearly_cost = (float(v) for v in kwh * kwh_price)
 
     # Mining revenue estimation (only if enabled)
     btc_per_block = 3.125
@@ -1492,13 +1786,9 @@ def detailed_analytics(request):
 
     if show_revenue and network_hashrate_ehs > 0:
         network_hashrate_ghs = network_hashrate_ehs * 1e9
-        daily_btc = (total_hashrate_ghs / network_hashrate_ghs) * blocks_per_day * btc_per_block
-        monthly_btc = daily_btc * 30
-        yearly_btc = daily_btc * 365
-
-        daily_revenue = daily_btc * btc_price
-        monthly_revenue = monthly_btc * btc_price
-        yearly_revenue = yearly_btc * btc_price
+        btc = (total_hashrate_ghs / network_hashrate_ghs) * blocks_per_day * btc_per_block * _PERIOD_SCALE
+        daily_btc, monthly_btc, yearly_btc = (float(v) for v in btc)
+        daily_revenue, monthly_revenue, yearly_revenue = (float(v) for v in btc * btc_price)
     else:
         daily_btc = monthly_btc = yearly_btc = 0
         daily_revenue = monthly_revenue = yearly_revenue = 0
@@ -1561,56 +1851,61 @@ def detailed_analytics(request):
         }
 
     # === DEVICE COMPARISON ===
+    # Three constant queries per family instead of three per device: the
+    # latest mining/hardware rows come from the latest-per-device subquery
+    # keyed by device id, and the per-device best difficulty is a single
+    # GROUP BY. values() keeps the latest-row fetches to the columns the
+    # comparison table reads, as plain dicts with no model instantiation.
     device_stats = []
-    for device in bitaxe_devices:
-        latest_mining = BitAxeMiningStats.objects.filter(device=device).first()
-        latest_hw = BitAxeHardwareLog.objects.filter(device=device).first()
-
-        # Get best difficulty for this device
-        device_best = BitAxeMiningStats.objects.filter(
-            device=device,
-            best_difficulty__isnull=False,
-            best_difficulty__gt=0
-        ).order_by('-best_difficulty').first()
-
-        if latest_mining and latest_hw:
-            device_stats.append({
-                'device_name': device.device_name,
-                'device_type': 'Bitaxe',
-                'hashrate_ghs': round(latest_mining.hashrate_ghs or 0, 2),
-                'power_watts': round(latest_hw.power_watts or 0, 1),
-                'temperature_c': round(latest_hw.temperature_c or 0, 1),
-                'efficiency_j_per_th': round(latest_hw.efficiency_j_per_th or 0, 2),
-                'best_difficulty': device_best.best_difficulty if device_best else 0,
-                'best_difficulty_formatted': _format_difficulty(device_best.best_difficulty) if device_best else '0',
-                'uptime_hours': round((latest_mining.uptime_seconds or 0) / 3600, 1),
-                'shares_accepted': latest_mining.shares_accepted or 0,
-                'shares_rejected': latest_mining.shares_rejected or 0,
-            })
-
-    for device in avalon_devices:
-        latest_mining = AvalonMiningStats.objects.filter(device=device).first()
-        latest_hw = AvalonHardwareLogs.objects.filter(device=device).first()
-
-        device_best = AvalonMiningStats.objects.filter(
-            device=device,
-            difficulty__gt=1000
-        ).order_by('-difficulty').first()
+    for family, devices, mining_model, hw_model, best_filter, best_field in (
+        ('Bitaxe', bitaxe_devices, BitAxeMiningStats, BitAxeHardwareLog,
+         Q(best_difficulty__isnull=False, best_difficulty__gt=0), 'best_difficulty'),
+        ('Avalon', avalon_devices, AvalonMiningStats, AvalonHardwareLogs,
+         Q(difficulty__gt=1000), 'difficulty'),
+    ):
+        latest_mining_by_dev = {
+            row['device_id']: row
+            for row in _latest_per_device(mining_model).filter(
+                device__is_active=True
+            ).values(
+                'device_id', 'hashrate_ghs', 'uptime_seconds',
+                'shares_accepted', 'shares_rejected',
+            )
+        }
+        latest_hw_by_dev = {
+            row['device_id']: row
+            for row in _latest_per_device(hw_model).filter(
+                device__is_active=True
+            ).values(
+                'device_id', 'power_watts', 'temperature_c', 'efficiency_j_per_th',
+            )
+        }
+        best_by_dev = dict(
+            mining_model.objects.filter(best_filter)
+            .values('device')
+            .annotate(best=Max(best_field))
+            .values_list('device', 'best')
+        )
 
-        if latest_mining and latest_hw:
-            device_stats.append({
-                'device_name': device.device_name,
-                'device_type': 'Avalon',
-                'hashrate_ghs': round(latest_mining.hashrate_ghs or 0, 2),
-                'power_watts': round(latest_hw.power_watts or 0, 1),
-                'temperature_c': round(latest_hw.temperature_c or 0, 1),
-                'efficiency_j_per_th': round(latest_hw.efficiency_j_per_th or 0, 2),
-                'best_difficulty': device_best.difficulty if device_best else 0,
-                'best_difficulty_formatted': _format_difficulty(device_best.difficulty) if device_best else '0',
-                'uptime_hours': round((latest_mining.uptime_seconds or 0) / 3600, 1),
-                'shares_accepted': latest_mining.shares_accepted or 0,
-                'shares_rejected': latest_mining.shares_rejected or 0,
-            })
+        for device in devices:
+            latest_mining = latest_mining_by_dev.get(device.pk)
+            latest_hw = latest_hw_by_dev.get(device.pk)
+            device_best = best_by_dev.get(device.pk, 0)
+
+            if latest_mining and latest_hw:
+                device_stats.append({
+                    'device_name': device.device_name,
+                    'device_type': family,
+                    'hashrate_ghs': round(latest_mining['hashrate_ghs'] or 0, 2),
+                    'power_watts': round(latest_hw['power_watts'] or 0, 1),
+                    'temperature_c': round(latest_hw['temperature_c'] or 0, 1),
+                    'efficiency_j_per_th': round(latest_hw['efficiency_j_per_th'] or 0, 2),
+                    'best_difficulty': device_best,
+                    'best_difficulty_formatted': _format_difficulty(device_best) if device_best else '0',
+                    'uptime_hours': round((latest_mining['uptime_seconds'] or 0) / 3600, 1),
+                    'shares_accepted': latest_mining['shares_accepted'] or 0,
+                    'shares_rejected': latest_mining['shares_rejected'] or 0,
+                })
 
     result['device_comparison'] = {
         'devices': sorted(device_stats, key=lambda x: x['hashrate_ghs'], reverse=True),
@@ -1618,20 +1913,22 @@ def detailed_analytics(request):
     }
 
     # === EFFICIENCY TRENDS (daily) ===
+    # Rounding and NULL handling happen in the aggregate, so the rows are
+    # emitted as-is; the recorded_at index covers the range scan.
     daily_efficiency = BitAxeHardwareLog.objects.filter(
         recorded_at__gte=start_time_days
     ).annotate(day=TruncDay('recorded_at')).values('day').annotate(
-        avg_efficiency=Avg('efficiency_j_per_th'),
-        avg_power=Avg('power_watts'),
-        avg_temp=Avg('temperature_c'),
+        avg_efficiency=Coalesce(Round(Avg('efficiency_j_per_th'), 2), 0.0),
+        avg_power=Round(Avg('power_watts'), 1),
+        avg_temp=Round(Avg('temperature_c'), 1),
     ).order_by('day')
 
     result['efficiency_trends'] = [
         {
             'date': item['day'].isoformat(),
-            'efficiency_j_per_th': round(item['avg_efficiency'] or 0, 2),
-            'avg_power_watts': round(item['avg_power'] or 0, 1),
-            'avg_temperature_c': round(item['avg_temp'] or 0, 1),
+            'efficiency_j_per_th': item['avg_efficiency'],
+            'avg_power_watts': item['avg_power'],
+            'avg_temperature_c': item['avg_temp'],
         }
         for item in daily_efficiency
     ]
@@ -1647,24 +1944,30 @@ def detailed_analytics(request):
         'power_consumption_trend': 'stable',  # Could be calculated from trends
     }
 
+    cache.set(cache_key, result, timeout=_analytics_cache_timeout())
     return Response(result)
 
 
+# Daily -> (daily, monthly, yearly) scale for the cost-analysis block.
+_PERIOD_SCALE = np.array([1.0, 30.0, 365.0])
+
+_DIFFICULTY_UNITS = ((1, ''), (1e3, 'K'), (1e6, 'M'), (1e9, 'G'), (1e12, 'T'), (1e15, 'P'))
+
+
 def _format_difficulty(difficulty):
-    """Format difficulty number to human-readable string."""
-    if difficulty is None or difficulty == 0:
+    """Format difficulty number to human-readable string.
+
+    The unit tier comes from log10 indexing into the table above rather
+    than a comparison cascade; the function runs once per share in the
+    top-shares and device-comparison loops.
+    """
+    if not difficulty:
         return '0'
-    if difficulty >= 1e15:
-        return f'{difficulty / 1e15:.2f}P'
-    if difficulty >= 1e12:
-        return f'{difficulty / 1e12:.2f}T'
-    if difficulty >= 1e9:
-        return f'{difficulty / 1e9:.2f}G'
-    if difficulty >= 1e6:
-        return f'{difficulty / 1e6:.2f}M'
-    if difficulty >= 1e3:
-        return f'{difficulty / 1e3:.2f}K'
-    return str(int(difficulty))
+    tier = min(max(int(math.log10(difficulty)) // 3, 0), 5)
+    divisor, suffix = _DIFFICULTY_UNITS[tier]
+    if not suffix:
+        return str(int(difficulty))
+    return f'{difficulty / divisor:.2f}{suffix}'
 
 
 def _format_time_duration(hours):
@@ -73,6 +73,12 @@ DATABASES = {
         'PASSWORD': config('POSTGRES_PASSWORD', default='changeme'),
         'HOST': config('POSTGRES_HOST', default='postgres'),
         'PORT': config('POSTGRES_PORT', default='5432'),
+        # Keep connections alive between requests so the analytics views
+        # (a dozen-plus queries each) do not pay a TCP + auth handshake
+        # per request. Health checks guard against reusing a connection
+        # Postgres dropped in the meantime.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -6,10 +6,15 @@ Settings are loaded from the database (collector_settings table).
 
 import logging
 import os
+import select
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
 import psycopg2
+import psycopg2.pool
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from collectors.avalon_collector import AvalonCollector
@@ -63,24 +68,55 @@ avalon_collector = AvalonCollector(DATABASE_URL)
 # Scheduler
 scheduler = BackgroundScheduler()
 
+# Connection pool, created lazily so importing the module does not require
+# a reachable database (the startup retry loop below establishes it).
+_pool = None
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = psycopg2.pool.ThreadedConnectionPool(1, 8, DATABASE_URL)
+    return _pool
+
+
+@contextmanager
+def get_conn():
+    """Borrow a pooled connection instead of opening a fresh one per query.
+
+    Every poll cycle used to pay a TCP + auth handshake for each of the
+    settings, device and pool-stats queries; the pool keeps those
+    connections open between cycles. On error the connection is closed
+    rather than recycled in an unknown state.
+    """
+    pool = _get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+        # End the implicit transaction so the connection is not returned
+        # idle-in-transaction (writes commit inside the collectors).
+        conn.rollback()
+        pool.putconn(conn)
+    except Exception:
+        pool.putconn(conn, close=True)
+        raise
+
 
 def load_settings_from_database():
     """Load collector settings from the database."""
     global collector_settings
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        cursor.execute("""
-            SELECT polling_interval_minutes, device_check_interval_minutes,
-                   pool_type, ckpool_address, ckpool_url,
-                   publicpool_address, publicpool_url,
-                   telegram_enabled, telegram_bot_token, telegram_chat_id,
-                   discord_enabled, discord_webhook_url
-            FROM collector_settings
-            WHERE id = 1
-        """)
-        row = cursor.fetchone()
+        with get_conn() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("""
+                SELECT polling_interval_minutes, device_check_interval_minutes,
+                       pool_type, ckpool_address, ckpool_url,
+                       publicpool_address, publicpool_url,
+                       telegram_enabled, telegram_bot_token, telegram_chat_id,
+                       discord_enabled, discord_webhook_url
+                FROM collector_settings
+                WHERE id = 1
+            """)
+            row = cursor.fetchone()
 
         if row:
             collector_settings = dict(row)
@@ -109,8 +145,6 @@ def load_settings_from_database():
         else:
             logger.warning("No settings found in database, using defaults")
 
-        cursor.close()
-        conn.close()
         return collector_settings
     except Exception as e:
         logger.error(f"Error loading settings from database: {e}", exc_info=True)
@@ -120,64 +154,54 @@ def load_settings_from_database():
 def load_active_devices():
     """Load active devices from database and update collectors."""
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        # Load Bitaxe devices
-        cursor.execute("""
-            SELECT device_id, device_name, ip_address
-            FROM bitaxe_devices
-            WHERE is_active = TRUE
-        """)
-        bitaxe_devices = cursor.fetchall()
+        with get_conn() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            # Load Bitaxe devices
+            cursor.execute("""
+                SELECT device_id, device_name, ip_address
+                FROM bitaxe_devices
+                WHERE is_active = TRUE
+            """)
+            bitaxe_devices = cursor.fetchall()
+
+            # Load Avalon devices
+            cursor.execute("""
+                SELECT device_id, device_name, ip_address
+                FROM avalon_devices
+                WHERE is_active = TRUE
+            """)
+            avalon_devices = cursor.fetchall()
+
         bitaxe_collector.update_devices(bitaxe_devices)
         logger.info(f"Loaded {len(bitaxe_devices)} active Bitaxe devices")
 
-        # Load Avalon devices
-        cursor.execute("""
-            SELECT device_id, device_name, ip_address
-            FROM avalon_devices
-            WHERE is_active = TRUE
-        """)
-        avalon_devices = cursor.fetchall()
         avalon_collector.update_devices(avalon_devices)
         logger.info(f"Loaded {len(avalon_devices)} active Avalon devices")
 
-        cursor.close()
-        conn.close()
-
         return bitaxe_devices, avalon_devices
     except Exception as e:
         logger.error(f"Error loading devices from database: {e}", exc_info=True)
         return [], []
 
 
-def poll_all_sources():
-    """Poll all data sources and store in database."""
-    logger.info("Starting data collection cycle")
-
-    # Reload settings from database (in case they changed)
-    load_settings_from_database()
-
-    # Reload devices from database before each collection
-    load_active_devices()
-
+def _poll_bitaxe():
     try:
-        # Poll Bitaxe devices
         logger.info("Polling Bitaxe devices...")
         bitaxe_collector.collect_all_devices()
         logger.info("Bitaxe polling completed")
     except Exception as e:
         logger.error(f"Error polling Bitaxe devices: {e}", exc_info=True)
 
+
+def _poll_avalon():
     try:
-        # Poll Avalon devices
         logger.info("Polling Avalon devices...")
         avalon_collector.collect_all_devices()
         logger.info("Avalon polling completed")
     except Exception as e:
         logger.error(f"Error polling Avalon devices: {e}", exc_info=True)
 
+
+def _poll_pool():
     # Poll pool statistics based on pool_type setting
     pool_type = collector_settings.get('pool_type', 'ckpool')
 
@@ -187,13 +211,12 @@ def poll_all_sources():
             publicpool_address = collector_settings.get('publicpool_address', '')
             if publicpool_address:
                 logger.info(f"Polling PublicPool statistics for address: {publicpool_address[:10]}...")
-                conn = psycopg2.connect(DATABASE_URL)
-                collect_publicpool_data(
-                    conn,
-                    publicpool_address,
-                    collector_settings.get('publicpool_url', 'http://localhost:3334')
-                )
-                conn.close()
+                with get_conn() as conn:
+                    collect_publicpool_data(
+                        conn,
+                        publicpool_address,
+                        collector_settings.get('publicpool_url', 'http://localhost:3334')
+                    )
                 logger.info("PublicPool polling completed")
             else:
                 logger.info("Skipping PublicPool polling - no address configured")
@@ -202,15 +225,33 @@ def poll_all_sources():
             ckpool_address = collector_settings.get('ckpool_address', '')
             if ckpool_address:
                 logger.info(f"Polling CKPool statistics for address: {ckpool_address[:10]}...")
-                conn = psycopg2.connect(DATABASE_URL)
-                collect_ckpool_data(conn, ckpool_address, collector_settings.get('ckpool_url', 'https://eusolo.ckpool.org'))
-                conn.close()
+                with get_conn() as conn:
+                    collect_ckpool_data(conn, ckpool_address, collector_settings.get('ckpool_url', 'https://eusolo.ckpool.org'))
                 logger.info("CKPool polling completed")
             else:
                 logger.info("Skipping CKPool polling - no address configured")
     except Exception as e:
         logger.error(f"Error polling pool ({pool_type}): {e}", exc_info=True)
 
+
+def poll_all_sources():
+    """Poll all data sources and store in database."""
+    logger.info("Starting data collection cycle")
+
+    # Reload settings from database (in case they changed)
+    load_settings_from_database()
+
+    # Reload devices from database before each collection
+    load_active_devices()
+
+    # The three sources are independent I/O (device HTTP/socket calls and
+    # pool APIs), so they run concurrently and the cycle takes as long as
+    # the slowest source, not the sum. Each poller catches and logs its
+    # own failures.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for poller in (_poll_bitaxe, _poll_avalon, _poll_pool):
+            executor.submit(poller)
+
     logger.info("Data collection cycle completed")
 
 
@@ -223,9 +264,10 @@ def reschedule_jobs():
         job.remove()
 
     polling_interval = collector_settings.get('polling_interval_minutes', 15)
-    device_check_interval = collector_settings.get('device_check_interval_minutes', 5)
 
-    # Schedule periodic polling
+    # Schedule periodic polling. Settings and device reloads are no
+    # longer on a timer: the LISTEN/NOTIFY thread applies them the
+    # moment the backend writes them.
     scheduler.add_job(
         func=poll_all_sources,
         trigger=IntervalTrigger(minutes=polling_interval),
@@ -234,25 +276,45 @@ def reschedule_jobs():
         replace_existing=True
     )
 
-    # Schedule periodic device check (reload devices more frequently)
-    scheduler.add_job(
-        func=load_active_devices,
-        trigger=IntervalTrigger(minutes=device_check_interval),
-        id='check_devices',
-        name='Check for new devices',
-        replace_existing=True
-    )
+    logger.info(f"Scheduled jobs: polling every {polling_interval}min; settings/device reloads are event-driven")
 
-    # Schedule settings reload (check for settings changes every 2 minutes)
-    scheduler.add_job(
-        func=check_and_apply_settings_changes,
-        trigger=IntervalTrigger(minutes=2),
-        id='check_settings',
-        name='Check for settings changes',
-        replace_existing=True
-    )
 
-    logger.info(f"Scheduled jobs: polling every {polling_interval}min, device check every {device_check_interval}min")
+def _settings_listener():
+    """Reload settings/devices when Postgres signals a change.
+
+    Triggers on collector_settings and the device tables (migration 0022)
+    fire NOTIFY settings_changed with the table name as payload. This
+    thread holds a dedicated connection in LISTEN mode and reloads only
+    what changed, replacing the fixed-interval settings and device
+    polling jobs. The connection is re-established after any error.
+    """
+    while True:
+        try:
+            conn = psycopg2.connect(DATABASE_URL)
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute("LISTEN settings_changed;")
+            logger.info("Listening for settings_changed notifications")
+
+            while True:
+                # Wake up periodically so a silently dead connection is
+                # noticed by the next poll() instead of blocking forever.
+                if select.select([conn], [], [], 60) == ([], [], []):
+                    continue
+                conn.poll()
+                if not conn.notifies:
+                    continue
+                tables = {n.payload for n in conn.notifies}
+                conn.notifies.clear()
+                logger.info(f"Change notification for: {', '.join(sorted(tables))}")
+
+                if 'collector_settings' in tables:
+                    check_and_apply_settings_changes()
+                if tables & {'bitaxe_devices', 'avalon_devices'}:
+                    load_active_devices()
+        except Exception as e:
+            logger.error(f"Settings listener error, reconnecting in 5s: {e}", exc_info=True)
+            time.sleep(5)
 
 
 def check_and_apply_settings_changes():
@@ -305,23 +367,18 @@ def status():
 
     # Get current device counts from database
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        cursor.execute("SELECT COUNT(*) as count FROM bitaxe_devices WHERE is_active = TRUE")
-        bitaxe_count = cursor.fetchone()['count']
-
-        cursor.execute("SELECT COUNT(*) as count FROM avalon_devices WHERE is_active = TRUE")
-        avalon_count = cursor.fetchone()['count']
+        with get_conn() as conn, conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("SELECT COUNT(*) as count FROM bitaxe_devices WHERE is_active = TRUE")
+            bitaxe_count = cursor.fetchone()['count']
 
-        cursor.execute("SELECT device_name, ip_address FROM bitaxe_devices WHERE is_active = TRUE")
-        bitaxe_list = cursor.fetchall()
+            cursor.execute("SELECT COUNT(*) as count FROM avalon_devices WHERE is_active = TRUE")
+            avalon_count = cursor.fetchone()['count']
 
-        cursor.execute("SELECT device_name, ip_address FROM avalon_devices WHERE is_active = TRUE")
-        avalon_list = cursor.fetchall()
+            cursor.execute("SELECT device_name, ip_address FROM bitaxe_devices WHERE is_active = TRUE")
+            bitaxe_list = cursor.fetchall()
 
-        cursor.close()
-        conn.close()
+            cursor.execute("SELECT device_name, ip_address FROM avalon_devices WHERE is_active = TRUE")
+            avalon_list = cursor.fetchall()
 
         return jsonify({
             'status': 'running',
@@ -367,8 +424,9 @@ if __name__ == '__main__':
     max_retries = 30
     for i in range(max_retries):
         try:
-            conn = psycopg2.connect(DATABASE_URL)
-            conn.close()
+            # Creating the pool opens its first connection, so this both
+            # probes the database and leaves the pool ready for use.
+            _get_pool()
             logger.info("Database connection established")
             break
         except psycopg2.OperationalError:
@@ -402,6 +460,9 @@ if __name__ == '__main__':
     scheduler.start()
     logger.info("Scheduler started")
 
+    # React to settings/device changes as they happen
+    threading.Thread(target=_settings_listener, daemon=True, name='settings-listener').start()
+
     # Run Flask app
     try:
         app.run(host='0.0.0.0', port=5000, debug=False)
@@ -7,6 +7,7 @@ import json
 import logging
 import re
 import socket
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import psycopg2
@@ -615,13 +616,19 @@ class AvalonCollector:
             self.update_device_status(device_id, device_ip, False, error_msg)
 
     def collect_all_devices(self):
-        """Collect data from all Avalon devices."""
+        """Collect data from all Avalon devices.
+
+        Devices are polled concurrently: each collection talks to its own
+        cgminer socket and database connection, so the cycle takes the
+        slowest device's latency instead of the sum of all of them.
+        """
         if not self.devices:
             logger.warning("No Avalon devices configured for collection")
             return
 
-        for device in self.devices:
-            device_id = device['device_id']
-            device_ip = device['ip_address']
-            logger.info(f"Collecting data for Avalon device: {device_id} at {device_ip}")
-            self.collect_device_data(device_id, device_ip)
+        with ThreadPoolExecutor(max_workers=min(len(self.devices), 8)) as executor:
+            for device in self.devices:
+                device_id = device['device_id']
+                device_ip = device['ip_address']
+                logger.info(f"Collecting data for Avalon device: {device_id} at {device_ip}")
+                executor.submit(self.collect_device_data, device_id, device_ip)
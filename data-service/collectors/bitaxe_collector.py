@@ -3,6 +3,7 @@ Bitaxe device collector
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import psycopg2
@@ -287,13 +288,22 @@ class BitAxeCollector:
             best_session_str = system_info.get('bestSessionDiff', '0')
             best_session_difficulty = self._parse_difficulty(best_session_str)
 
-            # Insert mining stats
+            # Calculate efficiency (J/TH)
+            # Efficiency = Power (W) / Hashrate (TH/s)
+            efficiency = (system_info.get('power', 0) / (hashrate_ghs / 1000.0)) if hashrate_ghs > 0 else 0
+
+            # Insert mining stats and hardware logs in one execute: a single
+            # network round trip for both rows, committed together below.
             cursor.execute("""
                 INSERT INTO bitaxe_mining_stats (
                     device_id, recorded_at, hashrate_ghs, shares_accepted,
                     shares_rejected, blocks_found, uptime_seconds,
                     best_difficulty, best_session_difficulty, pool_url, pool_user
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
+                INSERT INTO bitaxe_hardware_logs (
+                    device_id, recorded_at, power_watts, efficiency_j_per_th,
+                    temperature_c, fan_speed_rpm, voltage, frequency_mhz
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """, (
                 device_db_id,
                 recorded_at,
@@ -305,20 +315,7 @@ class BitAxeCollector:
                 best_difficulty_ever,      # best_difficulty = all-time best (from 'bestDiff')
                 best_session_difficulty,   # best_session_difficulty = session best (from 'bestSessionDiff')
                 system_info.get('stratumURL'),
-                system_info.get('stratumUser')
-            ))
-
-            # Calculate efficiency (J/TH)
-            # Efficiency = Power (W) / Hashrate (TH/s)
-            efficiency = (system_info.get('power', 0) / (hashrate_ghs / 1000.0)) if hashrate_ghs > 0 else 0
-
-            # Insert hardware logs
-            cursor.execute("""
-                INSERT INTO bitaxe_hardware_logs (
-                    device_id, recorded_at, power_watts, efficiency_j_per_th,
-                    temperature_c, fan_speed_rpm, voltage, frequency_mhz
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """, (
+                system_info.get('stratumUser'),
                 device_db_id,
                 recorded_at,
                 system_info.get('power', 0),
@@ -415,13 +412,19 @@ class BitAxeCollector:
         return value * multipliers.get(unit, 1)
 
     def collect_all_devices(self):
-        """Collect data from all Bitaxe devices."""
+        """Collect data from all Bitaxe devices.
+
+        Devices are polled concurrently: each collection is an independent
+        HTTP request plus its own database connection, so the cycle takes
+        the slowest device's latency instead of the sum of all of them.
+        """
         if not self.devices:
             logger.warning("No Bitaxe devices configured for collection")
             return
 
-        for device in self.devices:
-            device_id = device['device_id']
-            device_ip = device['ip_address']
-            logger.info(f"Collecting data for Bitaxe device: {device_id} at {device_ip}")
-            self.collect_device_data(device_id, device_ip)
+        with ThreadPoolExecutor(max_workers=min(len(self.devices), 8)) as executor:
+            for device in self.devices:
+                device_id = device['device_id']
+                device_ip = device['ip_address']
+                logger.info(f"Collecting data for Bitaxe device: {device_id} at {device_ip}")
+                executor.submit(self.collect_device_data, device_id, device_ip)
@@ -8,19 +8,11 @@ export function AuthProvider({ children }) {
   const [isLoading, setIsLoading] = useState(true)
   const [user, setUser] = useState(null)
 
-  // Verify session with backend
+  // Verify session with backend. The bootstrap endpoint also sets the
+  // CSRF cookie, so this single request covers the old csrf + user pair.
   const checkAuth = useCallback(async () => {
     try {
-      const sessionToken = localStorage.getItem('sessionToken')
-      if (!sessionToken) {
-        setIsAuthenticated(false)
-        setUser(null)
-        setIsLoading(false)
-        return false
-      }
-
-      // Verify session is still valid with backend
-      const response = await api.get('/api/auth/user/')
+      const response = await api.get('/api/auth/bootstrap/')
       if (response.data.authenticated) {
         setIsAuthenticated(true)
         setUser(response.data.user)
@@ -3,7 +3,7 @@ import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/com
 import { toast } from '@/components/ui/toaster'
 import api from '@/lib/api'
 import { Eye, EyeOff, Lock, Sparkles, User, Zap } from 'lucide-react'
-import { useEffect, useState } from 'react'
+import { useState } from 'react'
 
 export default function LoginPage({ onLogin }) {
   const [username, setUsername] = useState('')
@@ -11,18 +11,7 @@ export default function LoginPage({ onLogin }) {
   const [isLoading, setIsLoading] = useState(false)
   const [showPassword, setShowPassword] = useState(false)
 
-  // Fetch CSRF token on component mount
-  useEffect(() => {
-    const fetchCsrfToken = async () => {
-      try {
-        // Make a GET request to trigger CSRF cookie creation
-        await api.get('/api/auth/csrf/')
-      } catch (error) {
-        console.error('Failed to fetch CSRF token:', error)
-      }
-    }
-    fetchCsrfToken()
-  }, [])
+  // CSRF cookie is already set by the auth bootstrap call on app mount.
 
   const handleSubmit = async (e) => {
     e.preventDefault()
@@ -45,7 +45,7 @@ const mockLatestStats = {
 
 function buildMock(overrides = {}) {
   return (url) => {
-    if (url.includes('/api/auth/user/')) {
+    if (url.includes('/api/auth/bootstrap/')) {
       return Promise.resolve({ data: { authenticated: true, user: { id: 1 } } })
     }
     // Specific pool endpoints FIRST (before generic /api/bitaxe/pool/)
@@ -161,7 +161,7 @@ describe('MiningDashboard (smoke with API mocks)', () => {
   it('handles empty fallbacks from API (no crash on null/empty results)', async () => {
     // All calls return empty fallbacks
     api.get.mockImplementation((url) => {
-      if (url.includes('/api/auth/user/')) return Promise.resolve({ data: { authenticated: true, user: null } })
+      if (url.includes('/api/auth/bootstrap/')) return Promise.resolve({ data: { authenticated: true, user: null } })
       return Promise.resolve({ data: url.includes('devices') ? { results: [] } : null })
     })
     localStorage.setItem('sessionToken', 'test')
@@ -63,13 +63,13 @@ const mockAnalytics = {
 }
 
 function renderWithProviders(ui) {
-  // Ensure auth passes (token + mocked /api/auth/user/ response)
+  // Ensure auth passes (token + mocked /api/auth/bootstrap/ response)
   localStorage.setItem('sessionToken', 'test-token-123')
 
   // Make api.get resolve for both auth check and the page's analytics call
   const getMock = api.get
   getMock.mockImplementation((url) => {
-    if (url.includes('/api/auth/user/')) {
+    if (url.includes('/api/auth/bootstrap/')) {
       return Promise.resolve({ data: { authenticated: true, user: { id: 1, username: 'test' } } })
     }
     if (url.includes('/api/overview/analytics/')) {
@@ -151,7 +151,7 @@ describe('OverviewDashboard (smoke + integration with mocks)', () => {
   it('shows error state when analytics fetch fails (after initial load attempt)', async () => {
     // Override to reject for this test
     api.get.mockImplementation((url) => {
-      if (url.includes('/api/auth/user/')) {
+      if (url.includes('/api/auth/bootstrap/')) {
         return Promise.resolve({ data: { authenticated: true, user: null } })
       }
       if (url.includes('/api/overview/analytics/')) {